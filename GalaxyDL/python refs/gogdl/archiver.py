@@ -4,26 +4,608 @@ GOG Galaxy Archiver - Similar to SteamArchiver_Python but for GOG Galaxy CDN
 Collects and archives manifests, chunks, and metadata from GOG Galaxy CDN
 """
 
+import io
 import os
+import atexit
+import copy
+import contextlib
+import functools
+import re
 import json
+import operator
 import zlib
 import gzip
 import hashlib
 import time
+import mmap
 import logging
 import threading
+import weakref
+import xml.etree.ElementTree as ET
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set
-from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+from dataclasses import dataclass, fields
+from collections import OrderedDict, defaultdict, deque
+from itertools import chain, islice
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+import requests
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    from isal import igzip, isal_zlib
+except ImportError:
+    igzip = None
+    isal_zlib = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import deflate as libdeflate
+except ImportError:
+    libdeflate = None
+
+try:
+    import rapidgzip
+except ImportError:
+    rapidgzip = None
+
 import gogdl.api as api
 import gogdl.auth as auth
 from gogdl.dl import dl_utils
 from gogdl import constants
 from gogdl.dl.objects import v1, v2
 
+# Read size used when streaming manifests from the CDN
+STREAM_CHUNK_SIZE = 128 * 1024
+
+# gzip manifests larger than this (compressed) are inflated on all cores by rapidgzip (when installed)
+PARALLEL_GZIP_MIN_SIZE = 1024 * 1024
+
+# Decompressed depot manifests larger than this are parsed with ijson (when installed)
+STREAM_PARSE_MIN_SIZE = 10 * 1024 * 1024
+
+# Depot file records summarized per batch, which bounds memory for streamed manifests
+DEPOT_ITEMS_BATCH = 10000
+
+# Concurrent manifest downloads and matching HTTP connection pool size
+MANIFEST_FETCH_WORKERS = 16
+HTTP_POOL_SIZE = 32
+
+# Retries for transient CDN gateway errors, on the pooled connection
+HTTP_RETRIES = 3
+HTTP_RETRY_BACKOFF = 0.3
+
+# v1 blob progress JSON is rewritten after this many downloaded chunks, or this many seconds
+BLOB_JSON_FLUSH_CHUNKS = 10
+BLOB_JSON_FLUSH_SECONDS = 5.0
+
+# Concurrent HTTP range requests per v1 blob download (each holds up to a 100 MiB chunk)
+BLOB_RANGE_WORKERS = 4
+
+# Seconds a secure CDN link is reused before it is requested again
+SECURE_LINK_TTL = 240
+
+# Chunks verified (and re-downloaded when needed) concurrently
+CHUNK_VERIFY_WORKERS = HTTP_POOL_SIZE
+
+# Chunks verified between progress lines during repository verification
+VERIFY_PROGRESS_INTERVAL = 1000
+
+# Keep-alive connections held by the httpx CDN client (when httpx is installed)
+HTTPX_KEEPALIVE_CONNECTIONS = 64
+
+# Slice size fed to hashlib when verifying files on disk
+HASH_READ_SIZE = 1 << 20
+
+# Blob checksum chunks hashed concurrently (hashlib releases the GIL on large buffers)
+CHECKSUM_WORKERS = os.cpu_count() or 4
+
+# Quiet period before pending database changes are written
+SAVE_DEBOUNCE_SECONDS = 2.0
+
+# Archive database layout version, written on every save
+SCHEMA_VERSION = 2
+
+# Build record fields renamed since the first database layout
+_BUILD_KEY_RENAMES = {
+    'chunks_referenced': 'manifests_referenced',
+    'manifest_hash': 'build_hash',
+}
+
+# zstd level for the optional archive_database.json.zst copy (see compress_database)
+DATABASE_ZSTD_LEVEL = 3
+
+# Parsed build manifests kept in memory, keyed by path and mtime
+PARSED_MANIFEST_CACHE_SIZE = 16
+
+# Chunks hashed together when verifying against their MD5 names
+MD5_BATCH_SIZE = 8
+
+# Stands in for the chunk path in cached chunk URL templates
+_CHUNK_PATH_PLACEHOLDER = '{CHUNK_PATH}'
+
+# Build manifest CDN URL layouts
+_CDN_RE = re.compile(r'/(v[12])/(.+)$')
+_COLLECTOR_RE = re.compile(r'downloadable-manifests-collector\.gog\.com/manifests/builds/(.+)$')
+
+# ISA-L inflate when available, stdlib otherwise
+_GzipFile = igzip.IGzipFile if igzip else gzip.GzipFile
+_zlib_decompress = isal_zlib.decompress if isal_zlib else zlib.decompress
+_zlib_decompressobj = isal_zlib.decompressobj if isal_zlib else zlib.decompressobj
+_ZLIB_ERRORS = (zlib.error, isal_zlib.error) if isal_zlib else (zlib.error,)
+
+# Whole-buffer gzip inflate: libdeflate reads the output size from the gzip
+# trailer, so it is preferred here; its zlib entry point needs the size up
+# front, which manifests don't carry, so zlib stays on ISA-L/stdlib.
+if libdeflate:
+    _gzip_decompress = libdeflate.gzip_decompress
+elif igzip:
+    _gzip_decompress = igzip.decompress
+else:
+    _gzip_decompress = gzip.decompress
+
+
+def _inflate_gzip(raw_data) -> bytes:
+    """Whole-buffer gzip inflate, parallel across deflate blocks for large inputs when rapidgzip is installed"""
+    if rapidgzip and len(raw_data) > PARALLEL_GZIP_MIN_SIZE:
+        with rapidgzip.open(io.BytesIO(raw_data), parallelization=os.cpu_count()) as f:
+            return f.read()
+    return _gzip_decompress(raw_data)
+
+
+# Two-byte magic -> whole-buffer decompressor (zlib: 32K window at each level setting)
+_DECOMPRESSORS = {
+    b'\x1f\x8b': _inflate_gzip,
+    b'\x78\x01': _zlib_decompress,
+    b'\x78\x5e': _zlib_decompress,
+    b'\x78\x9c': _zlib_decompress,
+    b'\x78\xda': _zlib_decompress,
+}
+
+_hash_pool = None
+_hash_pool_lock = threading.Lock()
+
+
+def _get_hash_pool() -> ThreadPoolExecutor:
+    """Shared thread pool for hashlib work, created on first use"""
+    global _hash_pool
+    with _hash_pool_lock:
+        if _hash_pool is None:
+            _hash_pool = ThreadPoolExecutor(max_workers=MD5_BATCH_SIZE, thread_name_prefix="hash")
+    return _hash_pool
+
+
+def _md5_hex(data: bytes) -> str:
+    return hashlib.md5(data).hexdigest()
+
+
+def _batch_md5(buffers: List[bytes]) -> List[str]:
+    """MD5 hex digests for a batch of buffers, hashed concurrently
+
+    hashlib releases the GIL on large buffers, so each digest in the
+    batch runs on its own core.
+    """
+    if len(buffers) < 2:
+        return [_md5_hex(b) for b in buffers]
+    return list(_get_hash_pool().map(_md5_hex, buffers))
+
+
+def _digest_and_update(algorithm: str, data, overall=None) -> str:
+    """Hex digest of data, which is also fed to a running hash of the same algorithm"""
+    if overall is not None:
+        overall.update(data)
+    return hashlib.new(algorithm, data).hexdigest()
+
+
+def _parallel_digests(data, overall=(None, None, None)) -> Tuple[str, str, str]:
+    """(md5, sha1, sha256) hex digests of a buffer, each algorithm on its own pool thread
+
+    overall: running (md5, sha1, sha256) hashes to feed the buffer to as well.
+    Wall time is that of the slowest algorithm rather than the sum of all three.
+    """
+    pool = _get_hash_pool()
+    futures = [pool.submit(_digest_and_update, algorithm, data, running)
+               for algorithm, running in zip(('md5', 'sha1', 'sha256'), overall)]
+    return tuple(future.result() for future in futures)
+
+
+def _chunk_digests(view: memoryview) -> Tuple[str, str, str]:
+    """(md5, sha1, sha256) hex digests of a buffer slice, which is released afterwards"""
+    with view:
+        return hashlib.md5(view).hexdigest(), hashlib.sha1(view).hexdigest(), hashlib.sha256(view).hexdigest()
 
+
+def _map_readonly(f, size: int):
+    """Read-only mapping of an open file, or empty bytes for an empty one (mmap refuses those)"""
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else contextlib.nullcontext(b'')
+
+
+@contextlib.contextmanager
+def _mapped_view(path, drop_cache: bool = False):
+    """Read-only memoryview over a whole file's mapping (empty for an empty file)
+
+    The mapping is advised for sequential reads. With drop_cache, the file's
+    pages are evicted from the page cache afterwards (one-off passes over
+    large blobs). Slices taken from the view must be released
+    (with view[a:b] as ...) before the block exits, or the mapping can't be closed.
+    """
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        with _map_readonly(f, size) as mm, memoryview(mm) as mv:
+            if size and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            yield mv
+        if drop_cache and hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+def _chunk_matches(view, hashes: Dict) -> bool:
+    """Whether a chunk matches its recorded checksum, using the strongest one available"""
+    for algorithm in ('sha256', 'sha1', 'md5'):
+        if algorithm in hashes:
+            return hashlib.new(algorithm, view).hexdigest() == hashes[algorithm]
+    return False
+
+
+def _feed_hash(running, view: memoryview):
+    """Update a running hash with a buffer slice, which is released afterwards"""
+    with view:
+        running.update(view)
+
+
+def _hash_file(path, algorithm: str = 'sha256') -> str:
+    """Hex digest of a file, hashed straight from a read-only mapping"""
+    h = hashlib.new(algorithm)
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return h.hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            mv = memoryview(mm)
+            try:
+                for i in range(0, len(mv), HASH_READ_SIZE):
+                    h.update(mv[i:i + HASH_READ_SIZE])
+            finally:
+                mv.release()
+    return h.hexdigest()
+
+
+def _json_loads(data):
+    """Parse JSON bytes, with orjson when it is installed"""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+@functools.lru_cache(maxsize=8192)
+def _galaxy_path(manifest_id: str) -> str:
+    """'abcd...' -> 'ab/cd/abcd...' (ids that already contain a '/' are returned as is)"""
+    return dl_utils.galaxy_path(manifest_id)
+
+
+def _flush_at_exit(archiver_ref):
+    """atexit hook: write the pending database changes of an archiver that is still alive"""
+    archiver = archiver_ref()
+    if archiver is not None:
+        archiver._exit_hook_registered = False
+        archiver.flush()
+
+
+class DatabaseUnreadable(Exception):
+    """The archive database exists but can't be read (so it must not be written over either)"""
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    """Modification time of a file in nanoseconds, None if it is missing"""
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def read_archive_database(database_path: Path) -> Optional[dict]:
+    """Read the archive database
+
+    archive_database.json is the canonical file (the C# service reads and
+    writes it too). The archive_database.json.zst copy is used instead only
+    when it is at least as new, so a plain database written by something
+    else always wins. Returns None when neither exists; raises
+    DatabaseUnreadable when the one to use can't be decoded (e.g. only a
+    zstd copy and no zstandard installed).
+    """
+    zst_path = database_path.with_suffix('.json.zst')
+    json_mtime = _mtime_ns(database_path)
+    zst_mtime = _mtime_ns(zst_path)
+    try:
+        if zst_mtime is not None and (json_mtime is None or (zstandard and zst_mtime >= json_mtime)):
+            if zstandard is None:
+                raise DatabaseUnreadable(f"{zst_path} is zstd compressed; install zstandard to read it")
+            raw_data = zstandard.ZstdDecompressor().decompress(zst_path.read_bytes())
+        elif json_mtime is not None:
+            raw_data = database_path.read_bytes()
+        else:
+            return None
+        return _json_loads(raw_data)
+    except DatabaseUnreadable:
+        raise
+    except Exception as e:
+        raise DatabaseUnreadable(f"Failed to read archive database {database_path}: {e}") from e
+
+
+def _pretty_json(data, sort_keys: bool = False) -> bytes:
+    """Indented JSON bytes for the human-readable manifest copies and checksum files"""
+    if orjson:
+        option = orjson.OPT_INDENT_2 | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(data, option=option)
+    return json.dumps(data, indent=2, sort_keys=sort_keys).encode('utf-8')
+
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+_UPDATE_FLAGS = os.O_WRONLY | os.O_CREAT | getattr(os, 'O_BINARY', 0)
+
+
+def _write_at(fd: int, data, offset: int):
+    """Write a whole buffer at a file offset; os.pwrite where available (not on Windows)"""
+    with memoryview(data) as mv:
+        done = 0
+        while done < len(mv):
+            if hasattr(os, 'pwrite'):
+                done += os.pwrite(fd, mv[done:], offset + done)
+            else:
+                os.lseek(fd, offset + done, os.SEEK_SET)
+                done += os.write(fd, mv[done:])
+
+
+def _write_file(path, data: bytes):
+    """Write a whole file with raw open/write/close syscalls, no Python file object"""
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        with memoryview(data) as mv:
+            offset = 0
+            while offset < len(mv):
+                offset += os.write(fd, mv[offset:])
+    finally:
+        os.close(fd)
+
+
+def _write_stream(path, pieces) -> int:
+    """Write an iterable of byte strings to a file as they arrive, returning the total size"""
+    total = 0
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        for piece in pieces:
+            with memoryview(piece) as mv:
+                offset = 0
+                while offset < len(mv):
+                    offset += os.write(fd, mv[offset:])
+            total += len(piece)
+    finally:
+        os.close(fd)
+    return total
+
+
+def _hash_and_write(path, data: bytes, algorithm: str = 'md5') -> str:
+    """Write a whole file and hash it in one pass over the buffer, returning the hex digest"""
+    h = hashlib.new(algorithm)
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        with memoryview(data) as mv:
+            for i in range(0, len(mv), HASH_READ_SIZE):
+                piece = mv[i:i + HASH_READ_SIZE]
+                h.update(piece)
+                offset = 0
+                while offset < len(piece):
+                    offset += os.write(fd, piece[offset:])
+    finally:
+        os.close(fd)
+    return h.hexdigest()
+
+
+def _scan_dir_stats(directory, names: Set[str]) -> Dict[str, Tuple[int, int]]:
+    """Map file name -> (size, mtime_ns) for the regular files in one directory whose name is in names
+
+    Only those entries are stat()ed; a missing directory gives an empty map.
+    """
+    stats = {}
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name in names and entry.is_file():
+                    st = entry.stat()
+                    stats[entry.name] = (st.st_size, st.st_mtime_ns)
+    except FileNotFoundError:
+        pass
+    return stats
+
+
+def _decompress_manifest(raw_data: bytes) -> bytes:
+    """Inflate a gzip or zlib manifest; anything else (plain JSON) is returned as is"""
+    decompress = _DECOMPRESSORS.get(raw_data[:2])
+    return decompress(raw_data) if decompress else raw_data
+
+
+def _read_manifest(path) -> dict:
+    """Read and parse a gzip, zlib or plain JSON manifest file
+
+    The file is mapped rather than read, so the compressed bytes are never
+    copied onto the heap before being inflated.
+    """
+    with open(path, 'rb') as f:
+        with _map_readonly(f, os.fstat(f.fileno()).st_size) as mm:
+            decompress = _DECOMPRESSORS.get(mm[:2])
+            if decompress:
+                return _json_loads(decompress(mm))
+            if orjson:
+                with memoryview(mm) as mv:
+                    return orjson.loads(mv)
+            return json.loads(mm[:])
+
+
+def _scan_subdirs(directory) -> List[str]:
+    """Names of the subdirectories of a directory (empty if it is missing)"""
+    try:
+        with os.scandir(directory) as entries:
+            return [entry.name for entry in entries if entry.is_dir()]
+    except FileNotFoundError:
+        return []
+
+
+_get_size = operator.methodcaller('get', 'size', 0)
+_get_chunks = operator.methodcaller('get', 'chunks', ())
+_get_compressed_md5 = operator.methodcaller('get', 'compressedMd5')
+
+
+def _summarize_depot_files(items) -> Tuple[int, int, Set[str]]:
+    """(file count, total size, compressedMd5 set) over the DepotFile records of a v2 depot manifest
+
+    The per-chunk work runs in C iterator adapters (map/chain/filter) rather
+    than a Python loop; directories are skipped.
+    """
+    items = iter(items)
+    file_count = total_size = 0
+    chunks_referenced = set()
+    for batch in iter(lambda: list(islice(items, DEPOT_ITEMS_BATCH)), []):
+        files = [item for item in batch if item.get('type') == 'DepotFile']
+        file_count += len(files)
+        total_size += sum(map(int, map(_get_size, files)))
+        chunks_referenced.update(filter(None, map(_get_compressed_md5, chain.from_iterable(map(_get_chunks, files)))))
+    return file_count, total_size, chunks_referenced
+
+
+def _iter_depot_items(path):
+    """Yield the file records of a v2 depot manifest on disk
+
+    With ijson installed the manifest is parsed as a stream, so only one
+    record is alive at a time instead of the whole decoded document.
+    """
+    if not ijson:
+        yield from _read_manifest(path).get('depot', {}).get('items', [])
+        return
+
+    with open(path, 'rb') as f:
+        magic = f.read(2)
+        f.seek(0)
+        decompress = _DECOMPRESSORS.get(magic)
+        if decompress is _inflate_gzip:
+            stream = _GzipFile(fileobj=f)
+        elif decompress:
+            stream = io.BytesIO(decompress(f.read()))
+        else:
+            stream = f
+        yield from ijson.items(stream, 'depot.items.item')
+
+
+def _read_body_into(response, size: int, chunk_size: int = STREAM_CHUNK_SIZE,
+                    stop: Optional[threading.Event] = None) -> bytearray:
+    """Read a streamed response body into a buffer preallocated for size bytes
+
+    Pieces are copied into place as they arrive, so the body is never held
+    twice. The result is trimmed to (or grown to) the bytes actually received;
+    setting stop abandons the read early with whatever has arrived so far.
+    """
+    buf = bytearray(size)
+    pos = 0
+    for piece in response.iter_content(chunk_size):
+        if stop is not None and stop.is_set():
+            break
+        end = pos + len(piece)
+        buf[pos:end] = piece
+        pos = end
+    del buf[pos:]
+    return buf
+
+
+def _inflate_stream(response, chunk_size: int = STREAM_CHUNK_SIZE):
+    """Read a streamed response body, inflating zlib data as it arrives
+
+    Returns (raw_data, decompressed). decompressed is None when the body
+    is not a complete zlib stream (e.g. plain JSON).
+    """
+    # One decompressor per stream: zlib objects can't be reset once they reach
+    # end of stream, and copy() allocates a fresh window just like a new object
+    decompressor = _zlib_decompressobj(15)
+    raw_chunks = []
+    out = []
+    for chunk in response.iter_content(chunk_size):
+        raw_chunks.append(chunk)
+        if out is not None:
+            try:
+                out.append(decompressor.decompress(chunk))
+            except _ZLIB_ERRORS:
+                out = None
+
+    raw_data = b"".join(raw_chunks)
+    if out is None or not decompressor.eof:
+        return raw_data, None
+    return raw_data, b"".join(out)
+
+
+class _HttpxResponse:
+    """requests-style view (ok, iter_content) of an httpx response"""
+    
+    def __init__(self, response):
+        self._response = response
+        
+    @property
+    def ok(self) -> bool:
+        return self._response.status_code < 400
+        
+    def iter_content(self, chunk_size: int = 1):
+        return self._response.iter_bytes(chunk_size)
+        
+    def __getattr__(self, name):
+        return getattr(self._response, name)
+
+
+class _HttpxSession:
+    """GET-only stand-in for the API requests.Session, multiplexing CDN fetches over HTTP/2"""
+    
+    def __init__(self, session):
+        # Headers are read from the requests session per call so token refreshes carry over
+        self._session = session
+        limits = httpx.Limits(max_keepalive_connections=HTTPX_KEEPALIVE_CONNECTIONS)
+        try:
+            self.client = httpx.Client(http2=True, limits=limits, timeout=None, follow_redirects=True)
+        except ImportError:
+            # http2 needs the optional h2 package; keep-alive pooling still applies
+            self.client = httpx.Client(limits=limits, timeout=None, follow_redirects=True)
+            
+    def get(self, url: str, stream: bool = False) -> _HttpxResponse:
+        request = self.client.build_request('GET', url, headers=dict(self._session.headers))
+        return _HttpxResponse(self.client.send(request, stream=stream))
+
+
+def _slotted(cls):
+    """Rebuild a dataclass with __slots__ (dataclass(slots=True) needs Python 3.10)"""
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict = dict(cls.__dict__)
+    cls_dict['__slots__'] = field_names
+    for name in field_names:
+        # Defaults live on in the generated __init__
+        cls_dict.pop(name, None)
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+
+@_slotted
 @dataclass
 class ArchivedChunk:
     """Represents an archived chunk/blob from v2 manifests"""
@@ -36,7 +618,8 @@ class ArchivedChunk:
     last_verified: float
 
 
-@dataclass 
+@_slotted
+@dataclass
 class ArchivedBlob:
     """Represents an archived binary blob from v1 manifests (main.bin files)"""
     depot_manifest: str  # The blob URL identifier (e.g. "1207658930/main.bin")
@@ -47,9 +630,9 @@ class ArchivedBlob:
     last_verified: float
     files_contained: List[Dict] = None  # Optional - use manifests instead for file info
     depot_info: Dict = None  # Contains referencing manifests and metadata
-    depot_info: Dict     # Store depot metadata
 
 
+@_slotted
 @dataclass
 class ArchivedManifest:
     """Represents an archived depot manifest (v1 or v2)"""
@@ -63,9 +646,17 @@ class ArchivedManifest:
     timestamp: float
     file_count: int
     total_size: int  # Total uncompressed size of all files
-    chunks_referenced: Set[str]  # For v2: chunk MD5s, For v1: file hashes
-    
+    chunks_referenced: FrozenSet  # For v2: raw 16-byte chunk MD5 digests, For v1: file hashes
     
+    def __post_init__(self):
+        refs = self.chunks_referenced
+        if self.version == 2:
+            # Raw digests take well under half the memory of hex strings in records kept for the whole run
+            refs = (bytes.fromhex(md5) if isinstance(md5, str) else md5 for md5 in refs)
+        self.chunks_referenced = frozenset(refs)
+
+
+@_slotted
 @dataclass
 class ArchivedBuild:
     """Represents an archived build manifest"""
@@ -77,15 +668,29 @@ class ArchivedBuild:
     archive_path: str
     cdn_url: str
     timestamp: float
-    dependencies: List[str]
-    manifests_referenced: Set[str]
+    dependencies: Tuple[str, ...]
+    manifests_referenced: FrozenSet[str]
     repository_id: str = None  # Optional field for repository/manifest ID
     version_name: str = ""  # Game version string (e.g., "3.5.0.26g")
-    tags: List[str] = None  # Build tags (e.g., ["receiver_v1", "csb_10_6_1_w_158"])
+    tags: Tuple[str, ...] = None  # Build tags (e.g., ("receiver_v1", "csb_10_6_1_w_158"))
     
     def __post_init__(self):
-        if self.tags is None:
-            self.tags = []
+        # Records are not mutated once built; immutable containers are smaller and safe to share
+        self.tags = tuple(self.tags or ())
+        self.dependencies = tuple(self.dependencies or ())
+        self.manifests_referenced = frozenset(self.manifests_referenced)
+
+
+@_slotted
+@dataclass
+class ChunkReference:
+    """A v2 chunk referenced by a depot manifest on disk, as collected for verification"""
+    compressed_size: int
+    uncompressed_size: int
+    offset: int
+    file_path: str  # Shared with the other chunks of the same file
+    manifest_id: str
+    game_id: str  # Needed for secure link generation
 
 
 class GOGGalaxyArchiver:
@@ -93,8 +698,19 @@ class GOGGalaxyArchiver:
     GOG Galaxy CDN Archiver - Archives manifests, chunks, and metadata
     """
     
-    def __init__(self, archive_root: str, auth_config_path: str = None):
+    def __init__(self, archive_root: str, auth_config_path: str = None, prettify: bool = False,
+                 compress_database: bool = False):
         self.archive_root = Path(archive_root)
+        # Every save path is built under archive_root, see _archive_relative()
+        self._archive_root_prefix = os.path.join(str(self.archive_root), '')
+        
+        # Write human-readable .json copies next to raw manifests as they are archived
+        # (off by default; prettify_all() generates them on demand)
+        self.prettify = prettify
+        
+        # Also keep a zstd copy of the database for faster loads (off by default;
+        # archive_database.json is always written, since the C# service shares it)
+        self.compress_database = compress_database
         
         # Raw CDN data storage (mirrors CDN structure)
         self.builds_dir = self.archive_root / "builds"        # Raw build manifests
@@ -105,6 +721,7 @@ class GOGGalaxyArchiver:
         # Our processed data and indexes
         self.metadata_dir = self.archive_root / "metadata"    # Our database/indexes only
         self.database_path = self.metadata_dir / "archive_database.json"
+        self.chunk_index_path = self.metadata_dir / "chunks_index.json"  # Chunks verified by earlier runs
         
         # Create directories
         for dir_path in [self.builds_dir, self.manifests_dir, self.chunks_dir, self.blobs_dir, self.metadata_dir]:
@@ -114,128 +731,345 @@ class GOGGalaxyArchiver:
         if auth_config_path is not None:
             self.auth_manager = auth.AuthorizationManager(auth_config_path)
             self.api_handler = api.ApiHandler(self.auth_manager)
+            # Allow enough pooled connections for concurrent manifest downloads; retry
+            # gateway errors here rather than opening a fresh connection per attempt
+            retry = Retry(total=HTTP_RETRIES, backoff_factor=HTTP_RETRY_BACKOFF,
+                          status_forcelist=(502, 503, 504), raise_on_status=False)
+            adapter = requests.adapters.HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE,
+                                                    max_retries=retry)
+            self.api_handler.session.mount("https://", adapter)
+            # Manifest downloads from the CDN go through httpx when it is installed
+            self._http = _HttpxSession(self.api_handler.session) if httpx else self.api_handler.session
         else:
             self.auth_manager = None
             self.api_handler = None
+            self._http = None
         
         # Initialize logger
         self.logger = logging.getLogger("GOGGalaxyArchiver")
         
         # Archive database - streamlined to only track builds
         # Chunks, blobs, and manifests verified from file system
-        self.archived_builds: Dict[str, ArchivedBuild] = {}
+        self.archived_builds: Dict[Tuple[str, str, str], ArchivedBuild] = {}  # (game_id, build_id, platform)
         
         # TEMPORARY: Keep in-memory tracking for compatibility but don't save to database
         self.archived_chunks: Dict[str, ArchivedChunk] = {}  # In-memory only
         self.archived_blobs: Dict[str, ArchivedBlob] = {}    # In-memory only  
         self.archived_manifests: Dict[str, ArchivedManifest] = {}  # In-memory only
         
+        # Guards archived_builds when manifests are archived from worker threads
+        self._builds_lock = threading.Lock()
+        
+        # Secure CDN links per (game_id, path, generation): (fetched_at, urls)
+        self._secure_link_cache: Dict[Tuple[str, str, int], Tuple[float, list]] = {}
+        self._chunk_url_templates: Dict[str, Tuple[float, str]] = {}  # game_id -> (fetched_at, template)
+        self._secure_link_lock = threading.Lock()
+        
+        # Debounced database writes, see save_database()
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+        self._save_lock = threading.Lock()
+        # Registered while changes are pending; holds only a weak reference to the archiver
+        self._exit_hook = functools.partial(_flush_at_exit, weakref.ref(self))
+        self._exit_hook_registered = False
+        
+        # Directories already created by the save paths
+        self._made_dirs: Set[Path] = set()
+        self._made_dirs_lock = threading.Lock()
+        
+        # galaxy_paths under manifests/v2/depots and v2/meta, scanned on first use, see _existing_v2_depot_manifests()
+        self._v2_depot_manifests: Optional[Set[str]] = None
+        self._v2_depot_manifests_lock = threading.Lock()
+        
+        # Depot manifest tree roots as str, so per-depot checks are one join or prefix test
+        self._v1_depot_manifests_root = os.path.join(self.manifests_dir, "v1", "manifests")
+        self._v2_depots_prefix = os.path.join(self.manifests_dir, "v2", "depots", "")
+        self._v2_meta_prefix = os.path.join(self.manifests_dir, "v2", "meta", "")
+        
+        # Blob path -> size on disk (None when missing), see _blob_size()
+        self._blob_stat_cache: Dict[str, Optional[int]] = {}
+        
+        # Parsed build manifests, see _load_build_manifest()
+        self._parsed_manifest_cache: 'OrderedDict[Tuple[str, int], dict]' = OrderedDict()
+        self._parsed_manifest_lock = threading.Lock()
+        
         self.load_database()
         
-    def save_raw_build_manifest(self, cdn_url: str, raw_data: bytes, version: int) -> str:
-        """Save raw build manifest data exactly as received from CDN"""
-        # Use the same logic as _save_raw_build_manifest for consistent directory structure
-        if '/v1/' in cdn_url:
-            version_str = 'v1'
-            # v1 URLs are different: /v1/manifests/1207658930/windows/37794096/repository.json
-            url_parts = cdn_url.split('/v1/manifests/')
-            if len(url_parts) > 1:
-                path_part = url_parts[1]  # "1207658930/windows/37794096/repository.json"
-                raw_path = self.builds_dir / version_str / "manifests" / path_part
+    def _ensure_dir(self, path: Path):
+        """mkdir -p, skipping directories this archiver has already created"""
+        if path in self._made_dirs:
+            return
+        with self._made_dirs_lock:
+            if path not in self._made_dirs:
+                path.mkdir(parents=True, exist_ok=True)
+                self._made_dirs.add(path)
+        
+    def _load_build_manifest(self, build_manifest_path: Path) -> dict:
+        """Read, decompress and parse a build manifest on disk
+        
+        Results are cached per (path, mtime) so the entry points that walk the
+        same build don't parse it again. The returned dict is shared: treat it
+        as read-only.
+        """
+        key = (str(build_manifest_path), build_manifest_path.stat().st_mtime_ns)
+        with self._parsed_manifest_lock:
+            manifest_data = self._parsed_manifest_cache.get(key)
+            if manifest_data is not None:
+                self._parsed_manifest_cache.move_to_end(key)
+                return manifest_data
+        
+        # V2 manifests are usually compressed, V1 manifests are plain JSON
+        manifest_data = _read_manifest(build_manifest_path)
+        
+        with self._parsed_manifest_lock:
+            self._parsed_manifest_cache[key] = manifest_data
+            while len(self._parsed_manifest_cache) > PARSED_MANIFEST_CACHE_SIZE:
+                self._parsed_manifest_cache.popitem(last=False)
+        return manifest_data
+        
+    def _archive_relative(self, path: str) -> str:
+        """path relative to archive_root, by prefix strip (save paths always start with it)"""
+        if path.startswith(self._archive_root_prefix):
+            return path[len(self._archive_root_prefix):]
+        return str(Path(path).relative_to(self.archive_root))
+        
+    def _existing_v2_depot_manifests(self) -> Set[str]:
+        """galaxy_paths ('ab/cd/abcd...') of the v2 depot manifests on disk
+        
+        The three-level depots and meta trees are listed once with os.scandir;
+        manifests saved afterwards are added by _save_raw_depot_manifest.
+        """
+        with self._v2_depot_manifests_lock:
+            if self._v2_depot_manifests is None:
+                found = set()
+                for root in (self._v2_depots_prefix, self._v2_meta_prefix):
+                    for first in _scan_subdirs(root):
+                        for second in _scan_subdirs(os.path.join(root, first)):
+                            with os.scandir(os.path.join(root, first, second)) as entries:
+                                found.update(f"{first}/{second}/{entry.name}" for entry in entries if entry.is_file())
+                self._v2_depot_manifests = found
+            return self._v2_depot_manifests
+            
+    def _blob_size(self, blob_path) -> Optional[int]:
+        """Size of a blob on disk, or None if it is missing; stat() once and remembered
+        
+        Paths written by this archiver are dropped from the cache with _forget_blob_stat().
+        """
+        key = str(blob_path)
+        try:
+            return self._blob_stat_cache[key]
+        except KeyError:
+            pass
+        try:
+            size = os.stat(key).st_size
+        except FileNotFoundError:
+            size = None
+        self._blob_stat_cache[key] = size
+        return size
+        
+    def _forget_blob_stat(self, blob_path):
+        """Drop the cached size of a blob that was just (re)written"""
+        self._blob_stat_cache.pop(str(blob_path), None)
+        
+    def _write_pretty_build_manifest(self, save_path: Path, raw_data: bytes, version: Optional[str]):
+        """Write the human-readable JSON copy of a raw build manifest"""
+        if version == 'v1' and save_path.suffix == '.json':
+            # For v1 JSON files, add .pretty suffix before .json to avoid overwriting
+            json_path = save_path.with_suffix('.pretty.json')
+        else:
+            # For v2 files (no extension), add .json suffix
+            json_path = save_path.with_suffix('.json')
+            
+        try:
+            # Try to decompress and prettify
+            if version == 'v2':
+                try:
+                    decompressed = _zlib_decompress(raw_data, 15)
+                    manifest_data = _json_loads(decompressed)
+                except _ZLIB_ERRORS:
+                    # Not compressed, try as plain JSON
+                    manifest_data = _json_loads(raw_data)
             else:
-                # Fallback
-                filename = cdn_url.split('/')[-1]
-                raw_path = self.builds_dir / version_str / filename
-        elif '/v2/' in cdn_url:
-            version_str = 'v2'
-            # v2 URLs: /content-system/v2/meta/92/ab/92ab42631ff4742b309bb62c175e6306
-            url_parts = cdn_url.split('/v2/')
-            if len(url_parts) > 1:
-                path_part = url_parts[1]  # "meta/92/ab/92ab42631ff4742b309bb62c175e6306"
-                raw_path = self.builds_dir / version_str / path_part
+                # v1 manifests are typically plain JSON
+                manifest_data = _json_loads(raw_data)
+                
+            _write_file(json_path, _pretty_json(manifest_data))
+                
+            self.logger.debug(f"Saved prettified build manifest: {json_path}")
+        except Exception as e:
+            self.logger.warning(f"Failed to create prettified copy: {e}")
+            
+    def _write_pretty_depot_manifest(self, raw_path: str, depot_manifest: Dict):
+        """Write the human-readable JSON copy of a parsed depot manifest"""
+        _write_file(f"{raw_path}.json", _pretty_json(depot_manifest))
+        
+    def prettify_all(self) -> int:
+        """Write missing prettified JSON copies for every archived manifest
+        
+        Returns the number of copies written.
+        """
+        written = 0
+        
+        # v2 build manifests (extensionless, zlib) and v1 build manifests (plain .json)
+        for path in self.builds_dir.rglob('*'):
+            if not path.is_file():
+                continue
+            if path.suffix == '':
+                version = 'v2'
+                if path.with_suffix('.json').exists():
+                    continue
+            elif path.suffix == '.json' and not path.name.endswith('.pretty.json'):
+                if path.with_suffix('').exists():
+                    continue  # This is the copy of an extensionless v2 manifest
+                version = 'v1'
+                if path.with_suffix('.pretty.json').exists():
+                    continue
             else:
-                # Fallback
-                filename = cdn_url.split('/')[-1]
-                raw_path = self.builds_dir / version_str / filename
-        else:
-            # Unknown version, save in root
-            filename = cdn_url.split('/')[-1]
-            raw_path = self.builds_dir / filename
+                continue
+            self._write_pretty_build_manifest(path, path.read_bytes(), version)
+            written += 1
+            
+        # v2 depot manifests (extensionless, zlib or gzip)
+        for path in self.manifests_dir.rglob('*'):
+            if not path.is_file() or path.suffix != '' or path.with_name(f"{path.name}.json").exists():
+                continue
+            try:
+                depot_manifest = _json_loads(_decompress_manifest(path.read_bytes()))
+                self._write_pretty_depot_manifest(str(path), depot_manifest)
+                written += 1
+            except Exception as e:
+                self.logger.warning(f"Failed to create prettified copy of {path}: {e}")
+                
+        return written
+        
+    def _build_manifest_path(self, cdn_url: str):
+        """Map a build manifest CDN URL to (version, local path) preserving CDN structure"""
+        # v1: .../v1/manifests/1207658930/windows/37794096/repository.json
+        # v2: .../content-system/v2/meta/92/ab/92ab42631ff4742b309bb62c175e6306
+        # collector: https://downloadable-manifests-collector.gog.com/manifests/builds/2e/18/2e18ff86...
+        m = _CDN_RE.search(cdn_url)
+        if m:
+            version, path_part = m.group(1), m.group(2)
+            if version == 'v1':
+                if path_part.startswith('manifests/'):
+                    return version, self.builds_dir / version / path_part
+                return version, self.builds_dir / version / cdn_url.rsplit('/', 1)[-1]
+            return version, self.builds_dir / version / path_part
 
-        raw_path.parent.mkdir(parents=True, exist_ok=True)
+        m = _COLLECTOR_RE.search(cdn_url)
+        if m:
+            # Collector builds are generation 2
+            return 'v2', self.builds_dir / 'v2' / 'builds' / m.group(1)
+
+        # Unknown version, save in root
+        self.logger.debug(f"Unrecognised build manifest URL, saving to root: {cdn_url}")
+        return None, self.builds_dir / cdn_url.rsplit('/', 1)[-1]
+
+    def save_raw_build_manifest(self, cdn_url: str, raw_data: bytes, version: int) -> str:
+        """Save raw build manifest data exactly as received from CDN"""
+        _, raw_path = self._build_manifest_path(cdn_url)
+
+        self._ensure_dir(raw_path.parent)
         
         # Save exactly as received (compressed)
-        with open(raw_path, 'wb') as f:
-            f.write(raw_data)
+        _write_file(raw_path, raw_data)
             
         self.logger.debug(f"Saved raw build manifest: {raw_path} ({len(raw_data)} bytes)")
         return str(raw_path)
         
     def load_database(self):
-        """Load existing archive database - streamlined to only track builds"""
-        if self.database_path.exists():
-            try:
-                with open(self.database_path, 'r') as f:
-                    data = json.load(f)
-                    
-                # Load builds only - all other data comes from file system
-                for build_data in data.get('builds', []):
+        """Load existing archive database - streamlined to only track builds
+        
+        An existing database that can't be read raises DatabaseUnreadable rather
+        than starting empty, since the next save would lose its builds.
+        """
+        data = read_archive_database(self.database_path)
+        if data is None:
+            return
+            
+        try:
+            current = data.get('schema') == SCHEMA_VERSION
+            now = time.time()
+            
+            # Load builds only - all other data comes from file system
+            for build_data in data.get('builds', []):
+                if not current:
                     # Handle field name changes for backwards compatibility
-                    if 'chunks_referenced' in build_data:
-                        build_data['manifests_referenced'] = build_data.pop('chunks_referenced')
-                    if 'manifest_hash' in build_data:
-                        build_data['build_hash'] = build_data.pop('manifest_hash')
-                    
-                    # Ensure manifests_referenced is a set
-                    if 'manifests_referenced' in build_data:
-                        if isinstance(build_data['manifests_referenced'], list):
-                            build_data['manifests_referenced'] = set(build_data['manifests_referenced'])
-                    else:
-                        build_data['manifests_referenced'] = set()
-                        
-                    # Set default timestamp if missing
-                    if 'timestamp' not in build_data:
-                        build_data['timestamp'] = time.time()
-                        
-                    # Set default dependencies if missing
-                    if 'dependencies' not in build_data:
-                        build_data['dependencies'] = []
-                        
-                    build = ArchivedBuild(**build_data)
-                    key = f"{build.game_id}_{build.build_id}_{build.platform}"
-                    self.archived_builds[key] = build
+                    build_data = {_BUILD_KEY_RENAMES.get(k, k): v for k, v in build_data.items()}
                     
-                # Load manifests
-                for manifest_data in data.get('manifests', []):
-                    # Ensure chunks_referenced is a set
-                    if 'chunks_referenced' in manifest_data:
-                        if isinstance(manifest_data['chunks_referenced'], list):
-                            manifest_data['chunks_referenced'] = set(manifest_data['chunks_referenced'])
-                    else:
-                        manifest_data['chunks_referenced'] = set()
-                        
-                    # Ensure languages is a set 
-                    if 'languages' in manifest_data:
-                        if isinstance(manifest_data['languages'], list):
-                            manifest_data['languages'] = set(manifest_data['languages'])
-                    else:
-                        manifest_data['languages'] = set()
-                        
-                    manifest = ArchivedManifest(**manifest_data)
-                    self.archived_manifests[manifest.manifest_id] = manifest
-                    
-            except Exception as e:
-                self.logger.error(f"Failed to load database: {e}")
+                build = ArchivedBuild(**{
+                    'timestamp': now,
+                    'dependencies': [],
+                    **build_data,
+                    'manifests_referenced': frozenset(build_data.get('manifests_referenced', ())),
+                })
+                key = (build.game_id, build.build_id, build.platform)
+                self.archived_builds[key] = build
+                
+            # Load manifests (only present in databases from older versions)
+            for manifest_data in data.get('manifests', []):
+                manifest = ArchivedManifest(**{
+                    **manifest_data,
+                    'chunks_referenced': frozenset(manifest_data.get('chunks_referenced', ())),
+                    'languages': set(manifest_data.get('languages', ())),
+                })
+                self.archived_manifests[manifest.manifest_id] = manifest
+                
+            # Rewrite older databases once so later loads take the fast path
+            if not current and self.archived_builds:
+                self.save_database()
                 
+        except Exception as e:
+            self.logger.error(f"Failed to load database: {e}")
+            
     def save_database(self):
+        """Schedule an archive database write
+
+        Saves are coalesced: the database is written once SAVE_DEBOUNCE_SECONDS
+        after the last call, or immediately by flush().
+        """
+        with self._save_lock:
+            self._dirty = True
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(SAVE_DEBOUNCE_SECONDS, self._do_save)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+            if not self._exit_hook_registered:
+                atexit.register(self._exit_hook)
+                self._exit_hook_registered = True
+            
+    def flush(self):
+        """Write any pending database changes now"""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if self._exit_hook_registered:
+                atexit.unregister(self._exit_hook)
+                self._exit_hook_registered = False
+        self._do_save()
+        
+    def _do_save(self):
         """Save archive database - ONLY build manifests, no depot manifests/chunks/blobs tracking"""
+        with self._save_lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            self._write_database()
+            
+    def _write_database(self):
+        with self._builds_lock:
+            builds = list(self.archived_builds.values())
+            
         data = {
+            'schema': SCHEMA_VERSION,
             'builds': [],
             'last_updated': time.time()
         }
         
         # Save builds with only essential fields + metadata - NO manifests_referenced
-        for build in self.archived_builds.values():
+        for build in builds:
             build_dict = {
                 'game_id': build.game_id,
                 'build_id': build.build_id,
@@ -246,7 +1080,7 @@ class GOGGalaxyArchiver:
                 'cdn_url': build.cdn_url,
                 'repository_id': build.repository_id,
                 'version_name': getattr(build, 'version_name', ''),
-                'tags': getattr(build, 'tags', [])
+                'tags': list(getattr(build, 'tags', None) or [])
                 # NO manifests_referenced - file system is truth!
             }
             
@@ -254,102 +1088,45 @@ class GOGGalaxyArchiver:
             
         # NO manifests section - we don't track depot manifests in database!
         
-        with open(self.database_path, 'w') as f:
-            json.dump(data, f, indent=2)
-
-    def _save_raw_build_manifest(self, cdn_url: str, raw_data: bytes) -> str:
-        """Save raw build manifest data preserving CDN structure"""
-        # Debug: Log the URL being processed
-        print(f"DEBUG: Processing URL: {cdn_url}")
-        
-        # Parse CDN URL to get version and path
-        # Example: https://gog-cdn-fastly.gog.com/content-system/v2/meta/92/ab/92ab42631ff4742b309bb62c175e6306
-        if '/v1/' in cdn_url:
-            version = 'v1'
-            print(f"DEBUG: Detected V1 URL")
-            # v1 URLs are different: /v1/manifests/1207658930/windows/37794096/repository.json
-            url_parts = cdn_url.split('/v1/manifests/')
-            if len(url_parts) > 1:
-                path_part = url_parts[1]  # "1207658930/windows/37794096/repository.json"
-                save_path = self.builds_dir / version / "manifests" / path_part
-            else:
-                # Fallback
-                filename = cdn_url.split('/')[-1]
-                save_path = self.builds_dir / version / filename
-        elif '/v2/' in cdn_url:
-            version = 'v2'
-            print(f"DEBUG: Detected V2 URL")
-            # v2 URLs: /content-system/v2/meta/92/ab/92ab42631ff4742b309bb62c175e6306
-            url_parts = cdn_url.split('/v2/')
-            if len(url_parts) > 1:
-                path_part = url_parts[1]  # "meta/92/ab/92ab42631ff4742b309bb62c175e6306"
-                save_path = self.builds_dir / version / path_part
-                print(f"DEBUG: V2 path_part: {path_part}")
-                print(f"DEBUG: V2 save_path: {save_path}")
-            else:
-                # Fallback
-                filename = cdn_url.split('/')[-1]
-                save_path = self.builds_dir / version / filename
-                print(f"DEBUG: V2 fallback, filename: {filename}")
-        elif 'downloadable-manifests-collector.gog.com' in cdn_url and '/manifests/builds/' in cdn_url:
-            # New pattern: https://downloadable-manifests-collector.gog.com/manifests/builds/2e/18/2e18ff86c77e4960f905a9e5a1545468
-            version = 'v2'  # These appear to be v2 builds based on generation_queried: 2
-            print(f"DEBUG: Detected downloadable-manifests-collector URL")
-            url_parts = cdn_url.split('/manifests/builds/')
-            if len(url_parts) > 1:
-                path_part = url_parts[1]  # "2e/18/2e18ff86c77e4960f905a9e5a1545468"
-                save_path = self.builds_dir / version / "builds" / path_part
-                print(f"DEBUG: builds path_part: {path_part}")
-                print(f"DEBUG: builds save_path: {save_path}")
-            else:
-                # Fallback
-                filename = cdn_url.split('/')[-1]
-                save_path = self.builds_dir / version / "builds" / filename
-                print(f"DEBUG: builds fallback, filename: {filename}")
+        # Write to a temp file and swap it in so readers never see a partial database
+        tmp_path = self.database_path.with_suffix('.json.tmp')
+        if orjson:
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
         else:
-            # Unknown version, save in root
-            filename = cdn_url.split('/')[-1]
-            save_path = self.builds_dir / filename
-            print(f"DEBUG: UNKNOWN VERSION - fallback to root, filename: {filename}")
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f, indent=2)
+        os.replace(tmp_path, self.database_path)
+        
+        # The zstd copy is written second, so it is never older than the plain database it mirrors
+        if self.compress_database and zstandard:
+            if orjson:
+                payload = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+            else:
+                payload = json.dumps(data, separators=(',', ':')).encode('utf-8')
+            zst_path = self.database_path.with_suffix('.json.zst')
+            tmp_path = zst_path.with_suffix('.zst.tmp')
+            tmp_path.write_bytes(zstandard.ZstdCompressor(level=DATABASE_ZSTD_LEVEL).compress(payload))
+            os.replace(tmp_path, zst_path)
 
-        print(f"DEBUG: Final save_path: {save_path}")
+    def _save_raw_build_manifest(self, cdn_url: str, raw_data: bytes) -> Tuple[str, str]:
+        """Save raw build manifest data preserving CDN structure
+        
+        Returns (path, sha256 of raw_data); the hash is taken while writing.
+        """
+        version, save_path = self._build_manifest_path(cdn_url)
 
         # Create directories and save raw file
-        save_path.parent.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(save_path.parent)
         
-        with open(save_path, 'wb') as f:
-            f.write(raw_data)
+        build_hash = _hash_and_write(save_path, raw_data, 'sha256')
             
         # Also save prettified JSON copy next to the raw file
-        if version == 'v1' and save_path.suffix == '.json':
-            # For v1 JSON files, add .pretty suffix before .json to avoid overwriting
-            json_path = save_path.with_suffix('.pretty.json')
-        else:
-            # For v2 files (no extension), add .json suffix
-            json_path = save_path.with_suffix('.json')
-            
-        try:
-            # Try to decompress and prettify
-            if version == 'v2':
-                try:
-                    decompressed = zlib.decompress(raw_data, 15)
-                    manifest_data = json.loads(decompressed.decode('utf-8'))
-                except zlib.error:
-                    # Not compressed, try as plain JSON
-                    manifest_data = json.loads(raw_data.decode('utf-8'))
-            else:
-                # v1 manifests are typically plain JSON
-                manifest_data = json.loads(raw_data.decode('utf-8'))
-                
-            with open(json_path, 'w') as f:
-                json.dump(manifest_data, f, indent=2)
-                
-            self.logger.debug(f"Saved prettified build manifest: {json_path}")
-        except Exception as e:
-            self.logger.warning(f"Failed to create prettified copy: {e}")
+        if self.prettify:
+            self._write_pretty_build_manifest(save_path, raw_data, version)
             
         self.logger.debug(f"Saved raw build manifest: {save_path}")
-        return str(save_path)
+        return str(save_path), build_hash
 
     def _save_raw_depot_manifest(self, cdn_url: str, raw_data: bytes) -> str:
         """Save raw depot manifest data preserving CDN structure"""
@@ -380,47 +1157,75 @@ class GOGGalaxyArchiver:
             save_path = self.manifests_dir / filename
 
         # Create directories and save
-        save_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(save_path, 'wb') as f:
-            f.write(raw_data)
+        self._ensure_dir(save_path.parent)
+        _write_file(save_path, raw_data)
+        
+        # Keep the scanned depot manifest set current
+        save_path_str = str(save_path)
+        if save_path_str.startswith(self._v2_depots_prefix):
+            galaxy_path = save_path_str[len(self._v2_depots_prefix):].replace(os.sep, '/')
+            if galaxy_path.count('/') == 2:
+                with self._v2_depot_manifests_lock:
+                    if self._v2_depot_manifests is not None:
+                        self._v2_depot_manifests.add(galaxy_path)
             
         self.logger.debug(f"Saved raw depot manifest: {save_path}")
-        return str(save_path)
+        return save_path_str
 
     def _load_raw_depot_manifest(self, raw_path: str) -> dict:
         """Load and decompress raw depot manifest"""
-        with open(raw_path, 'rb') as f:
-            raw_data = f.read()
-            
-        # Check if it's compressed (most v2 manifests are gzip compressed)
         try:
-            import gzip
-            if raw_data.startswith(b'\x1f\x8b'):  # gzip magic number
-                decompressed = gzip.decompress(raw_data)
-                return json.loads(decompressed.decode('utf-8'))
-            else:
-                # Try as plain JSON
-                return json.loads(raw_data.decode('utf-8'))
+            return _read_manifest(raw_path)
         except Exception as e:
             self.logger.error(f"Failed to load raw depot manifest from {raw_path}: {e}")
             return None
 
-    def _save_raw_chunk(self, content_id: str, raw_data: bytes) -> str:
-        """Save raw chunk data preserving CDN structure: chunks/[2 chars]/[2 chars]/[full_md5]"""
+    def _chunk_dest_path(self, content_id: str) -> Path:
+        """Archive path of a chunk: chunks/[2 chars]/[2 chars]/[full_md5]"""
         # v2 chunks use compressedMd5 hash structure to match CDN paths exactly
         if len(content_id) >= 4:
-            prefix1 = content_id[:2]
-            prefix2 = content_id[2:4]
-            save_path = self.chunks_dir / prefix1 / prefix2 / content_id
-        else:
-            save_path = self.chunks_dir / content_id
+            return self.chunks_dir / content_id[:2] / content_id[2:4] / content_id
+        return self.chunks_dir / content_id
+        
+    def _stream_raw_chunk(self, content_id: str, response) -> Tuple[str, int]:
+        """Write a streamed chunk response to disk without holding the whole body
+        
+        The body goes to a .part file that is moved into place once complete.
+        Returns (path, bytes written).
+        """
+        save_path = self._chunk_dest_path(content_id)
+        self._ensure_dir(save_path.parent)
+        part_path = save_path.with_name(save_path.name + '.part')
+        try:
+            size = _write_stream(part_path, response.iter_content(STREAM_CHUNK_SIZE))
+        except BaseException:
+            if part_path.exists():
+                os.unlink(part_path)
+            raise
+        os.replace(part_path, save_path)
+        
+        self.logger.debug(f"Saved raw chunk: {save_path}")
+        return str(save_path), size
+        
+    def _save_raw_chunk(self, content_id: str, raw_data: bytes, expected_md5: str = None) -> str:
+        """Save raw chunk data preserving CDN structure: chunks/[2 chars]/[2 chars]/[full_md5]
+        
+        With expected_md5 the chunk is hashed in the same pass that writes it and
+        only moved into place if it matches; a mismatch raises ValueError.
+        """
+        save_path = self._chunk_dest_path(content_id)
             
         # Create directories and save
-        save_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(save_path, 'wb') as f:
-            f.write(raw_data)
+        self._ensure_dir(save_path.parent)
+        if expected_md5 is None:
+            _write_file(save_path, raw_data)
+        else:
+            part_path = save_path.with_name(save_path.name + '.part')
+            actual_hash = _hash_and_write(part_path, raw_data)
+            if actual_hash != expected_md5:
+                os.unlink(part_path)
+                raise ValueError(f"Chunk hash mismatch: expected {expected_md5}, got {actual_hash}")
+            os.replace(part_path, save_path)
             
         self.logger.debug(f"Saved raw chunk: {save_path}")
         return str(save_path)
@@ -436,28 +1241,17 @@ class GOGGalaxyArchiver:
             save_path = self.blobs_dir / blob_id
             
         # Create directories and save
-        save_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(save_path, 'wb') as f:
-            f.write(raw_data)
+        self._ensure_dir(save_path.parent)
+        _write_file(save_path, raw_data)
+        self._forget_blob_stat(save_path)
             
         self.logger.debug(f"Saved raw blob: {save_path}")
         return str(save_path)
 
     def _load_raw_build_manifest(self, raw_path: str) -> dict:
         """Load and decompress raw build manifest"""
-        with open(raw_path, 'rb') as f:
-            raw_data = f.read()
-            
-        # Check if it's compressed (most v2 manifests are gzip compressed)
         try:
-            import gzip
-            if raw_data.startswith(b'\x1f\x8b'):  # gzip magic number
-                decompressed = gzip.decompress(raw_data)
-                return json.loads(decompressed.decode('utf-8'))
-            else:
-                # Try as plain JSON
-                return json.loads(raw_data.decode('utf-8'))
+            return _read_manifest(raw_path)
         except Exception as e:
             self.logger.error(f"Failed to load raw manifest from {raw_path}: {e}")
             return None
@@ -469,55 +1263,84 @@ class GOGGalaxyArchiver:
             
         archived = []
         
-        for platform in platforms:
-            try:
-                # Get builds for this platform (comprehensive - both V1 and V2)
-                builds_data = self.api_handler.session.get(
-                    f"{constants.GOG_CONTENT_SYSTEM}/products/{game_id}/os/{platform}/builds"
-                )
-                
-                if not builds_data.ok:
+        with ThreadPoolExecutor(max_workers=MANIFEST_FETCH_WORKERS) as executor:
+            # Get builds for every platform concurrently
+            listing_futures = {
+                executor.submit(self._list_platform_builds, game_id, platform): platform
+                for platform in platforms
+            }
+            
+            # Queue one manifest download per (platform, build) as listings arrive
+            build_futures = {}
+            for future in as_completed(listing_futures):
+                platform = listing_futures[future]
+                try:
+                    builds = future.result()
+                except Exception as e:
+                    self.logger.error(f"Failed to archive manifests for {game_id}/{platform}: {e}")
                     continue
                     
-                builds = builds_data.json()
-                
-                for build in builds['items']:
-                    build_id = build['build_id']
+                for build in builds:
+                    build_future = executor.submit(self._fetch_and_archive_build, game_id, platform, build)
+                    build_futures[build_future] = (platform, build.get('build_id'))
                     
-                    # Check if we already have this manifest
-                    manifest_key = f"{game_id}_{build_id}_{platform}"
-                    if manifest_key in self.archived_builds:
-                        self.logger.info(f"Already archived: {manifest_key}")
-                        continue
-                        
-                    # Download and archive the manifest
-                    raw_response = self.api_handler.session.get(build['link'])
-                    if raw_response.ok:
-                        raw_data = raw_response.content
-                        
-                        # Decompress for processing
-                        try:
-                            manifest_data = json.loads(zlib.decompress(raw_data, 15))
-                        except zlib.error:
-                            manifest_data = raw_response.json()
-                            raw_data = json.dumps(manifest_data).encode('utf-8')  # Store as raw JSON if not compressed
-                        
-                        archived_manifest = self._archive_manifest(
-                            game_id, build_id, platform, manifest_data, build['link'], raw_data,
-                            version_name=build.get('version_name', ''),
-                            tags=build.get('tags', []),
-                            repository_id=build.get('legacy_build_id')
-                        )
-                        if archived_manifest:
-                            archived.append(archived_manifest)
-                    else:
-                        self.logger.warning(f"Failed to download manifest for {game_id}/{build_id}/{platform} - URL may be invalid: {build['link']}")
-                            
-            except Exception as e:
-                self.logger.error(f"Failed to archive manifests for {game_id}/{platform}: {e}")
+            for future in as_completed(build_futures):
+                platform, build_id = build_futures[future]
+                try:
+                    archived_manifest = future.result()
+                    if archived_manifest:
+                        archived.append(archived_manifest)
+                except Exception as e:
+                    self.logger.error(f"Failed to archive manifest for {game_id}/{build_id}/{platform}: {e}")
+                    
+        # Save database once after all builds are archived
+        if archived:
+            self.save_database()
                 
         return archived
         
+    def _list_platform_builds(self, game_id: str, platform: str) -> List[Dict]:
+        """Get builds for a platform (comprehensive - both V1 and V2)"""
+        builds_data = self.api_handler.session.get(
+            f"{constants.GOG_CONTENT_SYSTEM}/products/{game_id}/os/{platform}/builds"
+        )
+        
+        if not builds_data.ok:
+            return []
+            
+        return builds_data.json()['items']
+        
+    def _fetch_and_archive_build(self, game_id: str, platform: str, build: Dict) -> Optional[ArchivedBuild]:
+        """Download and archive a single build manifest from a builds listing entry"""
+        build_id = build['build_id']
+        
+        # Check if we already have this manifest
+        manifest_key = (game_id, build_id, platform)
+        if manifest_key in self.archived_builds:
+            self.logger.info(f"Already archived: {game_id}/{build_id}/{platform}")
+            return None
+            
+        # Download and archive the manifest
+        raw_response = self._http.get(build['link'], stream=True)
+        if not raw_response.ok:
+            self.logger.warning(f"Failed to download manifest for {game_id}/{build_id}/{platform} - URL may be invalid: {build['link']}")
+            return None
+            
+        # Decompress for processing while the body streams in
+        raw_data, decompressed = _inflate_stream(raw_response)
+        if decompressed is not None:
+            manifest_data = _json_loads(decompressed)
+        else:
+            # Plain JSON from the CDN, keep the bytes exactly as received
+            manifest_data = _json_loads(raw_data)
+        
+        return self._archive_manifest(
+            game_id, build_id, platform, manifest_data, build['link'], raw_data,
+            version_name=build.get('version_name', ''),
+            tags=build.get('tags', []),
+            repository_id=build.get('legacy_build_id')
+        )
+        
     def archive_build_manifests(self, game_id: str, build_id: str, platforms: List[str] = None) -> List[ArchivedBuild]:
         """Archive manifests for a specific build"""
         if not platforms:
@@ -558,23 +1381,22 @@ class GOGGalaxyArchiver:
                     continue
                 
                 # Check if we already have this manifest
-                manifest_key = f"{game_id}_{build_id}_{platform}"
+                manifest_key = (game_id, build_id, platform)
                 if manifest_key in self.archived_builds:
-                    self.logger.info(f"Already archived: {manifest_key}")
+                    self.logger.info(f"Already archived: {game_id}/{build_id}/{platform}")
                     archived.append(self.archived_builds[manifest_key])
                     continue
                     
                 # Download and archive the manifest
-                raw_response = self.api_handler.session.get(target_build['link'])
+                raw_response = self._http.get(target_build['link'], stream=True)
                 if raw_response.ok:
-                    raw_data = raw_response.content
-                    
-                    # Decompress for processing
-                    try:
-                        manifest_data = json.loads(zlib.decompress(raw_data, 15))
-                    except zlib.error:
-                        manifest_data = raw_response.json()
-                        raw_data = json.dumps(manifest_data).encode('utf-8')  # Store as raw JSON if not compressed
+                    # Decompress for processing while the body streams in
+                    raw_data, decompressed = _inflate_stream(raw_response)
+                    if decompressed is not None:
+                        manifest_data = _json_loads(decompressed)
+                    else:
+                        # Plain JSON from the CDN, keep the bytes exactly as received
+                        manifest_data = _json_loads(raw_data)
                     
                     archived_manifest = self._archive_manifest(
                         game_id, build_id, platform, manifest_data, target_build['link'], raw_data,
@@ -635,22 +1457,19 @@ class GOGGalaxyArchiver:
                 self.logger.info(f"Repository URL (V{repository_version}): {url}")
                     
                 # Download repository manifest
-                raw_response = self.api_handler.session.get(url)
+                raw_response = self._http.get(url, stream=True)
                 if raw_response.ok:
-                    raw_data = raw_response.content
-                    
-                    # Decompress for processing
+                    # Decompress for processing while the body streams in
                     try:
-                        if repository_version == 2:
+                        raw_data, decompressed = _inflate_stream(raw_response)
+                        if decompressed is not None:
+                            manifest_data = _json_loads(decompressed)
+                        elif repository_version == 2:
                             # V2 manifests are usually compressed
-                            manifest_data = json.loads(zlib.decompress(raw_data, 15))
+                            raise zlib.error("V2 repository manifest is not zlib compressed")
                         else:
-                            # V1 manifests might be plain JSON
-                            try:
-                                manifest_data = json.loads(zlib.decompress(raw_data, 15))
-                            except zlib.error:
-                                manifest_data = raw_response.json()
-                                raw_data = json.dumps(manifest_data).encode('utf-8')
+                            # V1 manifests might be plain JSON, keep the bytes exactly as received
+                            manifest_data = _json_loads(raw_data)
                     except Exception as e:
                         self.logger.error(f"Failed to decompress repository manifest: {e}")
                         continue
@@ -718,20 +1537,7 @@ class GOGGalaxyArchiver:
                 # Read the build manifest file directly to extract depot manifest IDs
                 build_manifest_path = self.archive_root / archived_build.archive_path
                 try:
-                    with open(build_manifest_path, 'rb') as f:
-                        raw_data = f.read()
-                    
-                    # Decompress if needed (V2 manifests are usually compressed)
-                    if archived_build.version == 2:
-                        if raw_data.startswith(b'\x1f\x8b'):  # gzip
-                            manifest_data = json.loads(gzip.decompress(raw_data).decode('utf-8'))
-                        elif raw_data.startswith(b'\x78'):  # zlib
-                            manifest_data = json.loads(zlib.decompress(raw_data).decode('utf-8'))
-                        else:
-                            manifest_data = json.loads(raw_data.decode('utf-8'))
-                    else:
-                        # V1 manifests are plain JSON
-                        manifest_data = json.loads(raw_data.decode('utf-8'))
+                    manifest_data = self._load_build_manifest(build_manifest_path)
                     
                     # Extract depot manifest IDs from the build manifest
                     depot_manifest_ids = []
@@ -761,50 +1567,42 @@ class GOGGalaxyArchiver:
             print(f"\n=== Depot Manifest Download Summary ===")
             print(f"Total depot manifests to process: {len(depot_manifests_to_download)}")
             
-            # Download each depot manifest (but not its chunks/blobs)
-            for manifest_id, version, platform, repo_id in depot_manifests_to_download:
-                print(f"\n📥 Processing depot manifest: {manifest_id}")
-                print(f"   Version: v{version}")
-                print(f"   Platform: {platform}")
-                
-                # Check if we already have this depot manifest on disk
-                if version == 2:
-                    # Check v2 depot manifest path
-                    galaxy_path = manifest_id if "/" in manifest_id else f"{manifest_id[0:2]}/{manifest_id[2:4]}/{manifest_id}"
-                    depot_path = self.archive_root / "manifests" / "v2" / "depots" / galaxy_path
-                    expected_url = f"https://downloadable-manifests-collector.gog.com/manifests/depots/{galaxy_path}"
-                else:
-                    # Check v1 depot manifest path  
-                    depot_path = self.archive_root / "manifests" / "v1" / "manifests" / game_id / platform / repo_id / manifest_id
-                    expected_url = f"https://gog-cdn-fastly.gog.com/content-system/v1/manifests/{game_id}/{platform}/{repo_id}/{manifest_id}"
-                
-                print(f"   🌐 Expected URL: {expected_url}")
-                print(f"   📁 Expected path: {depot_path}")
-                
-                if depot_path.exists():
-                    print(f"   ✅ Depot manifest already exists on disk - SKIPPING")
-                    results['depot_manifests_skipped'] += 1
-                    continue
-                
-                if version == 2:
-                    # Download v2 depot manifest (but skip chunks)
-                    depot_result = self._download_v2_depot_manifest_only(game_id, manifest_id)
-                else:
-                    # Download v1 depot manifest (but skip blob)
-                    depot_result = self._download_v1_depot_manifest_only(game_id, platform, archived_build.build_id, repo_id, manifest_id)
+            # Manifests already on disk are counted up front; only the rest go to the pool
+            to_fetch = [entry for entry in depot_manifests_to_download if not self._depot_manifest_on_disk(game_id, *entry)]
+            results['depot_manifests_skipped'] += len(depot_manifests_to_download) - len(to_fetch)
+            
+            # Download depot manifests (but not their chunks/blobs) concurrently
+            build_id = archived_build.build_id
+            with ThreadPoolExecutor(max_workers=MANIFEST_FETCH_WORKERS) as executor:
+                futures = {
+                    executor.submit(self._fetch_depot_manifest_only, game_id, manifest_id, version, platform, repo_id, build_id): manifest_id
+                    for manifest_id, version, platform, repo_id in to_fetch
+                }
                 
-                if depot_result['success']:
-                    if depot_result.get('already_exists'):
+                for future in as_completed(futures):
+                    manifest_id = futures[future]
+                    try:
+                        depot_result = future.result()
+                    except Exception as e:
+                        results['errors'].append(f"Failed to archive depot manifest {manifest_id}: {e}")
+                        print(f"❌ Failed to archive depot manifest: {manifest_id}")
+                        continue
+                        
+                    if depot_result is None:
+                        print(f"   ✅ Depot manifest already exists on disk - SKIPPING: {manifest_id}")
                         results['depot_manifests_skipped'] += 1
-                        print(f"⚡ Depot manifest already exists: {manifest_id}")
+                    elif depot_result['success']:
+                        if depot_result.get('already_exists'):
+                            results['depot_manifests_skipped'] += 1
+                            print(f"⚡ Depot manifest already exists: {manifest_id}")
+                        else:
+                            results['depot_manifests_archived'] += 1
+                            print(f"✅ Successfully archived depot manifest: {manifest_id}")
+                            if 'chunks_found' in depot_result and 'files_found' in depot_result:
+                                print(f"   📊 {depot_result['files_found']} files, {depot_result['total_size']:,} bytes, {depot_result['chunks_found']} chunks")
                     else:
-                        results['depot_manifests_archived'] += 1
-                        print(f"✅ Successfully archived depot manifest: {manifest_id}")
-                        if 'chunks_found' in depot_result and 'files_found' in depot_result:
-                            print(f"   📊 {depot_result['files_found']} files, {depot_result['total_size']:,} bytes, {depot_result['chunks_found']} chunks")
-                else:
-                    results['errors'].extend(depot_result['errors'])
-                    print(f"❌ Failed to archive depot manifest: {manifest_id}")
+                        results['errors'].extend(depot_result['errors'])
+                        print(f"❌ Failed to archive depot manifest: {manifest_id}")
             
             # Save database after processing all manifests
             self.save_database()
@@ -845,7 +1643,8 @@ class GOGGalaxyArchiver:
                 return results
             
             # Collect all chunks from all depot manifests (deduplicated)
-            all_chunks = {}  # chunk_id -> chunk_info
+            all_chunks: Dict[str, ChunkReference] = {}
+            seen_chunks: Set[str] = set()  # Shared with the extractor so duplicates are skipped early
             
             for archived_build in archived_builds:
                 print(f"\n=== Scanning Repository {repository_id} for Chunks ===")
@@ -854,20 +1653,7 @@ class GOGGalaxyArchiver:
                 # Read the build manifest file to get depot manifest IDs
                 build_manifest_path = self.archive_root / archived_build.archive_path
                 try:
-                    with open(build_manifest_path, 'rb') as f:
-                        raw_data = f.read()
-                    
-                    # Decompress if needed
-                    if archived_build.version == 2:
-                        if raw_data.startswith(b'\x1f\x8b'):  # gzip
-                            manifest_data = json.loads(gzip.decompress(raw_data).decode('utf-8'))
-                        elif raw_data.startswith(b'\x78'):  # zlib
-                            manifest_data = json.loads(zlib.decompress(raw_data).decode('utf-8'))
-                        else:
-                            manifest_data = json.loads(raw_data.decode('utf-8'))
-                    else:
-                        # V1 manifests are plain JSON
-                        manifest_data = json.loads(raw_data.decode('utf-8'))
+                    manifest_data = self._load_build_manifest(build_manifest_path)
                     
                     # Extract depot manifest IDs
                     depot_manifest_ids = []
@@ -886,11 +1672,9 @@ class GOGGalaxyArchiver:
                     # Scan each depot manifest for chunks
                     for manifest_id in depot_manifest_ids:
                         print(f"   📋 Scanning depot manifest: {manifest_id}")
-                        chunks_from_manifest = self._extract_chunks_from_depot_manifest(game_id, manifest_id, archived_build.version)
-                        print(f"      Found {len(chunks_from_manifest)} chunks in this manifest")
-                        for chunk_id, chunk_info in chunks_from_manifest.items():
-                            if chunk_id not in all_chunks:
-                                all_chunks[chunk_id] = chunk_info
+                        chunks_from_manifest = self._extract_chunks_from_depot_manifest(game_id, manifest_id, archived_build.version, seen_chunks)
+                        print(f"      Found {len(chunks_from_manifest)} new chunks in this manifest")
+                        all_chunks.update(chunks_from_manifest)
                                 
                 except Exception as e:
                     error_msg = f"Failed to read repository manifest {archived_build.archive_path}: {e}"
@@ -905,53 +1689,69 @@ class GOGGalaxyArchiver:
                 print("No chunks found to verify")
                 return results
             
-            # Now verify each chunk and download missing/corrupted ones
+            # Now verify each chunk and download missing/corrupted ones, many at a time
             print(f"\n🔍 Verifying {len(all_chunks)} chunks...")
-            chunk_count = 0
-            for chunk_id, chunk_info in all_chunks.items():
-                chunk_count += 1
-                
-                # Show detailed verification for every chunk
-                print(f"   🔍 [{chunk_count}/{len(all_chunks)}] Verifying chunk: {chunk_id}")
-                
-                chunk_status = self._verify_chunk_integrity(chunk_id, chunk_info)
-                
-                # Show the result of each verification
-                if chunk_status == 'ok':
-                    print(f"      ✅ Chunk exists and is valid")
-                elif chunk_status == 'missing':
-                    print(f"      ❌ Chunk is missing")
-                elif chunk_status == 'corrupted':
-                    print(f"      ⚠️  Chunk is corrupted (size mismatch)")
+            
+            # Chunks verified by a previous run count as ok while their size and mtime still
+            # match the index entry; everything else (changed, missing, unindexed) is checked
+            chunk_index = self._load_chunk_index()
+            chunk_stats = self._scan_chunk_stats(all_chunks)
+            chunk_sizes = {chunk_id: stat[0] for chunk_id, stat in chunk_stats.items()}
+            unchanged = {chunk_id for chunk_id in all_chunks
+                         if chunk_id in chunk_stats and chunk_index.get(chunk_id) == list(chunk_stats[chunk_id])}
+            if unchanged:
+                results['chunks_verified_ok'] += len(unchanged)
+                print(f"   ✅ {len(unchanged)} chunks unchanged since their last verification")
+            chunk_count = len(unchanged)
+            chunk_errors = []
+            with ThreadPoolExecutor(max_workers=CHUNK_VERIFY_WORKERS) as executor:
+                futures = {
+                    executor.submit(self._verify_and_repair_chunk, chunk_id, chunk_info, chunk_sizes): chunk_id
+                    for chunk_id, chunk_info in all_chunks.items() if chunk_id not in unchanged
+                }
                 
-                if chunk_status == 'ok':
-                    results['chunks_verified_ok'] += 1
-                elif chunk_status == 'missing':
-                    results['chunks_missing'] += 1
-                    # Download missing chunk
-                    print(f"📥 Downloading missing chunk: {chunk_id}")
-                    if self._download_chunk(chunk_id, chunk_info):
-                        results['chunks_downloaded'] += 1
-                        print(f"✅ Downloaded missing chunk: {chunk_id}")
+                for future in as_completed(futures):
+                    chunk_id = futures[future]
+                    chunk_info = all_chunks[chunk_id]
+                    chunk_count += 1
+                    try:
+                        chunk_status, downloaded = future.result()
+                    except Exception as e:
+                        chunk_errors.append(f"Failed to verify chunk {chunk_id}: {e}")
+                        continue
+                    
+                    # Show progress every VERIFY_PROGRESS_INTERVAL chunks and at the end
+                    if chunk_count % VERIFY_PROGRESS_INTERVAL == 0 or chunk_count == len(all_chunks):
+                        print(f"   🔍 [{chunk_count}/{len(all_chunks)}] chunks verified")
+                    self.logger.debug(f"Verified chunk {chunk_id}: {chunk_status}")
+                    if chunk_status == 'ok':
+                        results['chunks_verified_ok'] += 1
+                        chunk_index[chunk_id] = list(chunk_stats[chunk_id])
+                        continue
+                    
+                    # Re-downloaded (or still broken) chunks are checked on disk next time
+                    chunk_index.pop(chunk_id, None)
+                        
+                    if chunk_status == 'missing':
+                        results['chunks_missing'] += 1
+                        action = "download missing"
                     else:
-                        manifest_id = chunk_info.get('manifest_id', 'unknown')
-                        file_path = chunk_info.get('file_path', 'unknown')
-                        error_msg = f"Failed to download missing chunk: {chunk_id} from manifest {manifest_id} (file: {file_path})"
-                        results['errors'].append(error_msg)
-                        print(f"❌ {error_msg}")
-                elif chunk_status == 'corrupted':
-                    results['chunks_corrupted'] += 1
-                    # Re-download corrupted chunk
-                    print(f"🔄 Re-downloading corrupted chunk: {chunk_id}")
-                    if self._download_chunk(chunk_id, chunk_info):
+                        results['chunks_corrupted'] += 1
+                        action = "re-download corrupted"
+                        
+                    if downloaded:
                         results['chunks_downloaded'] += 1
-                        print(f"✅ Re-downloaded corrupted chunk: {chunk_id}")
+                        self.logger.debug(f"Downloaded chunk: {chunk_id}")
                     else:
-                        manifest_id = chunk_info.get('manifest_id', 'unknown')
-                        file_path = chunk_info.get('file_path', 'unknown')
-                        error_msg = f"Failed to re-download corrupted chunk: {chunk_id} from manifest {manifest_id} (file: {file_path})"
-                        results['errors'].append(error_msg)
-                        print(f"❌ {error_msg}")
+                        manifest_id = chunk_info.manifest_id or 'unknown'
+                        file_path = chunk_info.file_path or 'unknown'
+                        chunk_errors.append(f"Failed to {action} chunk: {chunk_id} from manifest {manifest_id} (file: {file_path})")
+            
+            results['errors'].extend(chunk_errors)
+            self._save_chunk_index(chunk_index)
+            # Report chunk failures once, after the progress lines
+            for error_msg in chunk_errors:
+                print(f"❌ {error_msg}")
             
             print(f"\n=== Chunk Verification Complete ===")
             print(f"Chunks verified OK: {results['chunks_verified_ok']}")
@@ -966,19 +1766,22 @@ class GOGGalaxyArchiver:
             
         return results
         
-    def _extract_chunks_from_depot_manifest(self, game_id: str, manifest_id: str, version: int) -> Dict[str, Dict]:
-        """Extract all chunks from a depot manifest file on disk"""
+    def _extract_chunks_from_depot_manifest(self, game_id: str, manifest_id: str, version: int,
+                                            seen: Optional[Set[str]] = None) -> Dict[str, ChunkReference]:
+        """Extract all chunks from a depot manifest file on disk
+        
+        Chunk IDs already in seen are skipped; new ones are added to it.
+        """
+        if seen is None:
+            seen = set()
         chunks = {}
         
         try:
             # Find the depot manifest file on disk
             if version == 2:
-                galaxy_path = manifest_id if "/" in manifest_id else f"{manifest_id[0:2]}/{manifest_id[2:4]}/{manifest_id}"
+                galaxy_path = _galaxy_path(manifest_id)
                 # Check both possible locations
-                depot_paths = [
-                    self.archive_root / "manifests" / "v2" / "depots" / galaxy_path,
-                    self.archive_root / "manifests" / "v2" / "meta" / galaxy_path
-                ]
+                depot_paths = [self._v2_depots_prefix + galaxy_path, self._v2_meta_prefix + galaxy_path]
             else:
                 # V1 depot manifest paths are more complex, need platform/repository context
                 # For now, skip V1 chunk extraction (can be added later if needed)
@@ -986,7 +1789,7 @@ class GOGGalaxyArchiver:
             
             depot_manifest_path = None
             for path in depot_paths:
-                if path.exists():
+                if os.path.exists(path):
                     depot_manifest_path = path
                     break
             
@@ -994,151 +1797,224 @@ class GOGGalaxyArchiver:
                 self.logger.warning(f"Depot manifest {manifest_id} not found on disk")
                 return chunks
             
-            # Load and parse the depot manifest
-            with open(depot_manifest_path, 'rb') as f:
-                raw_data = f.read()
-            
-            # Decompress if needed
+            # Stream the file records and collect their chunks
             try:
-                import gzip
-                if raw_data.startswith(b'\x1f\x8b'):  # gzip
-                    decompressed_data = gzip.decompress(raw_data)
-                    depot_manifest = json.loads(decompressed_data.decode('utf-8'))
-                elif raw_data.startswith(b'\x78'):  # zlib
-                    decompressed_data = zlib.decompress(raw_data, 15)
-                    depot_manifest = json.loads(decompressed_data.decode('utf-8'))
-                else:
-                    depot_manifest = json.loads(raw_data.decode('utf-8'))
+                for file_record in _iter_depot_items(depot_manifest_path):
+                    if file_record.get('type') == 'DepotFile':
+                        for chunk in file_record.get('chunks', []):
+                            chunk_id = chunk.get('compressedMd5')
+                            if chunk_id and chunk_id not in seen:
+                                seen.add(chunk_id)
+                                chunks[chunk_id] = ChunkReference(
+                                    compressed_size=int(chunk.get('compressedSize', 0)),
+                                    uncompressed_size=int(chunk.get('size', 0)),
+                                    offset=int(chunk.get('offset', 0)),
+                                    file_path=file_record.get('path', ''),
+                                    manifest_id=manifest_id,
+                                    game_id=game_id
+                                )
             except Exception as e:
                 self.logger.error(f"Failed to parse depot manifest {manifest_id}: {e}")
-                return chunks
-            
-            # Extract chunks from all files in the depot
-            depot_data = depot_manifest.get('depot', {})
-            for file_record in depot_data.get('items', []):
-                if file_record.get('type') == 'DepotFile':
-                    for chunk in file_record.get('chunks', []):
-                        chunk_id = chunk.get('compressedMd5')
-                        if chunk_id:
-                            chunks[chunk_id] = {
-                                'compressed_size': chunk.get('compressedSize', 0),
-                                'uncompressed_size': chunk.get('size', 0),
-                                'offset': chunk.get('offset', 0),
-                                'file_path': file_record.get('path', ''),
-                                'manifest_id': manifest_id,
-                                'game_id': game_id  # Include game_id for secure link generation
-                            }
+                # Nothing from this manifest is returned, so forget what it marked as seen
+                seen.difference_update(chunks)
+                return {}
             
         except Exception as e:
             self.logger.error(f"Failed to extract chunks from depot manifest {manifest_id}: {e}")
         
         return chunks
     
-    def _verify_chunk_integrity(self, chunk_id: str, chunk_info: Dict) -> str:
+    def _load_chunk_index(self) -> Dict[str, list]:
+        """Chunk ID -> [size, mtime_ns] of the chunks earlier verify runs found intact
+        
+        Entries in the older size-only format never match a scan, so those
+        chunks are checked again. Delete metadata/chunks_index.json to force
+        every chunk to be checked on disk again.
+        """
+        try:
+            with open(self.chunk_index_path, 'rb') as f:
+                return _json_loads(f.read())
+        except FileNotFoundError:
+            return {}
+        except ValueError as e:
+            self.logger.warning(f"Ignoring unreadable chunk index {self.chunk_index_path}: {e}")
+            return {}
+            
+    def _save_chunk_index(self, chunk_index: Dict[str, list]):
+        """Write the chunk index next to the database, swapping it in atomically"""
+        tmp_path = self.chunk_index_path.with_suffix('.json.tmp')
+        if orjson:
+            payload = orjson.dumps(chunk_index)
+        else:
+            payload = json.dumps(chunk_index, separators=(',', ':')).encode('utf-8')
+        _write_file(tmp_path, payload)
+        os.replace(tmp_path, self.chunk_index_path)
+        
+    def _scan_chunk_stats(self, chunk_ids) -> Dict[str, Tuple[int, int]]:
+        """Map chunk ID -> (size, mtime_ns) for the chunks of chunk_ids that are on disk
+        
+        Each two-level prefix directory is listed once with os.scandir, so
+        missing chunks cost no failed lookups; the chunks that are present are
+        still stat()ed one by one for their size and mtime. Directories are
+        listed concurrently so those calls overlap.
+        """
+        prefixes = defaultdict(set)
+        for chunk_id in chunk_ids:
+            prefixes[os.path.join(self.chunks_dir, chunk_id[:2], chunk_id[2:4])].add(chunk_id)
+        stats = {}
+        with ThreadPoolExecutor(max_workers=CHUNK_VERIFY_WORKERS) as executor:
+            for prefix_stats in executor.map(_scan_dir_stats, prefixes.keys(), prefixes.values()):
+                stats.update(prefix_stats)
+        return stats
+    
+    def _verify_and_repair_chunk(self, chunk_id: str, chunk_info: ChunkReference, chunk_sizes: Dict[str, int] = None) -> Tuple[str, bool]:
+        """Verify a chunk and download it if missing or corrupted
+        
+        Returns (status, downloaded) where status is 'ok', 'missing' or 'corrupted'.
+        """
+        chunk_status = self._verify_chunk_integrity(chunk_id, chunk_info, chunk_sizes)
+        if chunk_status == 'ok':
+            return chunk_status, False
+        return chunk_status, self._download_chunk(chunk_id, chunk_info)
+        
+    def _verify_chunk_integrity(self, chunk_id: str, chunk_info: ChunkReference, chunk_sizes: Dict[str, int] = None) -> str:
         """Verify if a chunk exists and has correct integrity
         
+        chunk_sizes is an optional pre-scanned chunk ID -> size map (see _scan_chunk_stats);
+        when given, no filesystem calls are made for the existence/size check.
+        
         Returns: 'ok', 'missing', or 'corrupted'
         """
         try:
             # Build chunk file path
             chunk_path = self.chunks_dir / chunk_id[:2] / chunk_id[2:4] / chunk_id
             
-            print(f"         🔍 Checking file: {chunk_path}")
+            self.logger.debug(f"Checking chunk file: {chunk_path}")
             
-            if not chunk_path.exists():
-                print(f"         ❌ File does not exist")
+            if chunk_sizes is not None:
+                actual_size = chunk_sizes.get(chunk_id)
+            else:
+                # One stat() answers both "does it exist" and "how big is it"
+                try:
+                    actual_size = os.stat(chunk_path).st_size
+                except FileNotFoundError:
+                    actual_size = None
+            
+            if actual_size is None:
+                self.logger.debug(f"Chunk {chunk_id} does not exist")
                 return 'missing'
             
             # Verify file size matches expected compressed size
-            actual_size = chunk_path.stat().st_size
-            expected_size = chunk_info.get('compressed_size', 0)
+            expected_size = chunk_info.compressed_size
             
-            print(f"         📏 File size: {actual_size} bytes (expected: {expected_size} bytes)")
+            self.logger.debug(f"Chunk {chunk_id} size: {actual_size} bytes (expected: {expected_size} bytes)")
             
             if expected_size > 0 and actual_size != expected_size:
-                print(f"         ⚠️  Size mismatch!")
+                self.logger.debug(f"Chunk {chunk_id} size mismatch")
                 return 'corrupted'
             
-            print(f"         ✅ File exists and size matches")
-            # TODO: Could add MD5 hash verification here if needed
-            # For now, size check is sufficient
+            self.logger.debug(f"Chunk {chunk_id} exists and size matches")
             return 'ok'
             
         except Exception as e:
-            print(f"         💥 Exception during verification: {e}")
             self.logger.error(f"Failed to verify chunk {chunk_id}: {e}")
             return 'corrupted'
     
-    def _download_chunk(self, chunk_id: str, chunk_info: Dict) -> bool:
+    def _get_secure_link_cached(self, game_id: str, path: str = "/", generation: int = 2) -> list:
+        """dl_utils.get_secure_link, reusing the result for SECURE_LINK_TTL seconds
+        
+        Callers get their own copy of the endpoints, so they may edit parameters freely.
+        """
+        key = (game_id, path, generation)
+        with self._secure_link_lock:
+            cached = self._secure_link_cache.get(key)
+            if cached is None or time.time() - cached[0] >= SECURE_LINK_TTL:
+                urls = dl_utils.get_secure_link(self.api_handler, path, game_id, generation=generation)
+                cached = (time.time(), urls)
+                if urls:
+                    self._secure_link_cache[key] = cached
+        return copy.deepcopy(cached[1])
+    
+    def _get_v1_blob_url(self, game_id: str, platform: str, repository_id: str) -> Optional[str]:
+        """Authenticated main.bin URL for a v1 repository (shares the secure link cache)"""
+        secure_links = self._get_secure_link_cached(game_id, f"/{platform}/{repository_id}/", generation=1)
+        if not secure_links:
+            return None
+        
+        if isinstance(secure_links, str):
+            return f"{secure_links}/main.bin"
+        endpoint = secure_links[0]
+        endpoint["parameters"]["path"] += "/main.bin"
+        return dl_utils.merge_url_with_params(endpoint["url_format"], endpoint["parameters"])
+    
+    def _get_chunk_url_template(self, game_id: str) -> Optional[str]:
+        """Authenticated chunk URL for a game with _CHUNK_PATH_PLACEHOLDER in place of the path
+        
+        Built once per secure link lifetime, so each chunk URL is a single str.replace.
+        """
+        with self._secure_link_lock:
+            cached = self._chunk_url_templates.get(game_id)
+            if cached is not None and time.time() - cached[0] < SECURE_LINK_TTL:
+                return cached[1]
+            
+        secure_links = self._get_secure_link_cached(game_id)
+        if not secure_links:
+            return None
+        
+        # Use first endpoint, like the existing _download_v2_chunks method
+        endpoint = secure_links[0]
+        parameters = dict(endpoint["parameters"], path=_CHUNK_PATH_PLACEHOLDER)
+        template = dl_utils.merge_url_with_params(endpoint["url_format"], parameters)
+        with self._secure_link_lock:
+            self._chunk_url_templates[game_id] = (time.time(), template)
+        return template
+    
+    def _download_chunk(self, chunk_id: str, chunk_info: ChunkReference) -> bool:
         """Download a missing or corrupted chunk using secure links"""
         try:
-            game_id = chunk_info.get('game_id')
+            game_id = chunk_info.game_id
             if not game_id:
                 self.logger.error(f"No game_id in chunk_info for chunk {chunk_id}")
                 return False
             
-            # Get secure links for the game to get the correct CDN URL with authentication
-            # from gogdl.dl import dl_utils
-            secure_links = dl_utils.get_secure_link(
-                self.api_handler, "/", game_id, generation=2
-            )
+            # Authenticated CDN URL for this game, with a placeholder for the chunk path
+            url_template = self._get_chunk_url_template(game_id)
             
-            if not secure_links:
+            if not url_template:
                 self.logger.error(f"Failed to get secure links for game {game_id}")
                 return False
             
-            # DEBUG: Log the secure links we received
-            print(f"DEBUG: Secure links for game {game_id}:")
-            for i, link in enumerate(secure_links):
-                print(f"  {i}: url_format='{link.get('url_format', 'N/A')}'")
-                print(f"     parameters={link.get('parameters', {})}")
-            
-            # Build chunk URL using secure links (like the existing _download_v2_chunks method)
-            base_endpoint = secure_links[0]  # Use first endpoint
-            endpoint = base_endpoint.copy()
-            
             # Build the chunk path using the correct store structure (not /chunks/)
             # Working path: /content-system/v2/store/{game_id}/{chunk_id[:2]}/{chunk_id[2:4]}/{chunk_id}
             chunk_path = f"/content-system/v2/store/{game_id}/{chunk_id[:2]}/{chunk_id[2:4]}/{chunk_id}"
-            endpoint["parameters"]["path"] = chunk_path
-            
-            print(f"DEBUG: Modified endpoint parameters: {endpoint['parameters']}")
-            
-            # Merge URL with parameters to get the final authenticated URL
-            chunk_url = dl_utils.merge_url_with_params(
-                endpoint["url_format"], endpoint["parameters"]
-            )
-            
-            print(f"DEBUG: Final chunk URL: {chunk_url}")
-            print(f"DEBUG: Chunk info: manifest_id={chunk_info.get('manifest_id')}, file_path={chunk_info.get('file_path')}")
-            
-            # Extract just the domain to see what CDN we're hitting
-            cdn_domain = chunk_url.split('/')[2] if '://' in chunk_url else 'unknown'
-            print(f"DEBUG: CDN Domain: {cdn_domain}")
+            chunk_url = url_template.replace(_CHUNK_PATH_PLACEHOLDER, chunk_path)
             
-            self.logger.debug(f"Downloading chunk {chunk_id} from: {chunk_url}")
+            debug = self.logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                # Extract just the domain to see what CDN we're hitting
+                cdn_domain = chunk_url.split('/')[2] if '://' in chunk_url else 'unknown'
+                self.logger.debug(f"Downloading chunk {chunk_id} from: {chunk_url} (CDN: {cdn_domain})")
+                self.logger.debug(f"Chunk info: manifest_id={chunk_info.manifest_id}, file_path={chunk_info.file_path}")
             
-            response = self.api_handler.session.get(chunk_url)
-            print(f"DEBUG: Response status: {response.status_code}")
-            if not response.ok:
-                print(f"DEBUG: Response headers: {dict(response.headers)}")
-                if response.text:
-                    print(f"DEBUG: Response body: {response.text[:200]}...")
-            
-            if response.ok:
-                raw_data = response.content
-                
-                # Verify size if available
-                expected_size = chunk_info.get('compressed_size', 0)
-                if expected_size > 0 and len(raw_data) != expected_size:
-                    self.logger.warning(f"Downloaded chunk {chunk_id} size mismatch: expected {expected_size}, got {len(raw_data)}")
+            # Pooled CDN client (HTTP/2 over httpx when installed), body streamed to disk
+            response = self._http.get(chunk_url, stream=True)
+            try:
+                if not response.ok:
+                    if debug:
+                        self.logger.debug(f"Response headers: {dict(response.headers)}")
+                    self.logger.error(f"Failed to download chunk {chunk_id}: HTTP {response.status_code}")
+                    return False
+                    
+                # Save chunk to disk as it arrives
+                _, written = self._stream_raw_chunk(chunk_id, response)
+            finally:
+                response.close()
                 
-                # Save chunk to disk
-                self._save_raw_chunk(chunk_id, raw_data)
-                return True
-            else:
-                self.logger.error(f"Failed to download chunk {chunk_id}: HTTP {response.status_code}")
-                return False
+            # Verify size if available
+            expected_size = chunk_info.compressed_size
+            if expected_size > 0 and written != expected_size:
+                self.logger.warning(f"Downloaded chunk {chunk_id} size mismatch: expected {expected_size}, got {written}")
+            return True
                 
         except Exception as e:
             self.logger.error(f"Failed to download chunk {chunk_id}: {e}")
@@ -1177,22 +2053,7 @@ class GOGGalaxyArchiver:
                 # Read the build manifest file directly to extract depot manifest IDs
                 build_manifest_path = self.archive_root / archived_build.archive_path
                 try:
-                    with open(build_manifest_path, 'rb') as f:
-                        raw_data = f.read()
-                    
-                    # Decompress if needed (V2 manifests are usually compressed)
-                    if archived_build.version == 2:
-                        if raw_data.startswith(b'\x1f\x8b'):  # gzip
-                            import gzip
-                            manifest_data = json.loads(gzip.decompress(raw_data).decode('utf-8'))
-                        elif raw_data.startswith(b'\x78'):  # zlib
-                            import zlib
-                            manifest_data = json.loads(zlib.decompress(raw_data).decode('utf-8'))
-                        else:
-                            manifest_data = json.loads(raw_data.decode('utf-8'))
-                    else:
-                        # V1 manifests are plain JSON
-                        manifest_data = json.loads(raw_data.decode('utf-8'))
+                    manifest_data = self._load_build_manifest(build_manifest_path)
                     
                     # Extract depot manifest IDs from the build manifest
                     depot_manifest_ids = []
@@ -1222,44 +2083,35 @@ class GOGGalaxyArchiver:
             print(f"\n=== Depot Manifest Download Summary ===")
             print(f"Total depot manifests to process: {len(depot_manifests_to_download)}")
             
-            # Download each depot manifest (but not its chunks/blobs)
-            for manifest_id, version, platform, repository_id in depot_manifests_to_download:
-                print(f"\n📥 Processing depot manifest: {manifest_id}")
-                print(f"   Version: v{version}")
-                print(f"   Platform: {platform}")
-                
-                # Check if we already have this depot manifest on disk
-                if version == 2:
-                    # Check v2 depot manifest path
-                    galaxy_path = manifest_id if "/" in manifest_id else f"{manifest_id[0:2]}/{manifest_id[2:4]}/{manifest_id}"
-                    depot_path = self.archive_root / "manifests" / "v2" / "depots" / galaxy_path
-                    expected_url = f"https://downloadable-manifests-collector.gog.com/manifests/depots/{galaxy_path}"
-                else:
-                    # Check v1 depot manifest path  
-                    depot_path = self.archive_root / "manifests" / "v1" / "manifests" / game_id / platform / repository_id / manifest_id
-                    expected_url = f"https://gog-cdn-fastly.gog.com/content-system/v1/manifests/{game_id}/{platform}/{repository_id}/{manifest_id}"
-                
-                print(f"   🌐 Expected URL: {expected_url}")
-                print(f"   📁 Expected path: {depot_path}")
-                
-                if depot_path.exists():
-                    print(f"   ✅ Depot manifest already exists on disk - SKIPPING")
-                    results['depot_manifests_skipped'] += 1
-                    continue
-                
-                if version == 2:
-                    # Download v2 depot manifest (but skip chunks)
-                    depot_result = self._download_v2_depot_manifest_only(game_id, manifest_id)
-                else:
-                    # Download v1 depot manifest (but skip blob)
-                    depot_result = self._download_v1_depot_manifest_only(game_id, platform, build_id, repository_id, manifest_id)
+            # Manifests already on disk are counted up front; only the rest go to the pool
+            to_fetch = [entry for entry in depot_manifests_to_download if not self._depot_manifest_on_disk(game_id, *entry)]
+            results['depot_manifests_skipped'] += len(depot_manifests_to_download) - len(to_fetch)
+            
+            # Download depot manifests (but not their chunks/blobs) concurrently
+            with ThreadPoolExecutor(max_workers=MANIFEST_FETCH_WORKERS) as executor:
+                futures = {
+                    executor.submit(self._fetch_depot_manifest_only, game_id, manifest_id, version, platform, repository_id, build_id): manifest_id
+                    for manifest_id, version, platform, repository_id in to_fetch
+                }
                 
-                if depot_result['success']:
-                    results['depot_manifests_archived'] += 1
-                    print(f"✅ Successfully archived depot manifest: {manifest_id}")
-                else:
-                    results['errors'].extend(depot_result['errors'])
-                    print(f"❌ Failed to archive depot manifest: {manifest_id}")
+                for future in as_completed(futures):
+                    manifest_id = futures[future]
+                    try:
+                        depot_result = future.result()
+                    except Exception as e:
+                        results['errors'].append(f"Failed to archive depot manifest {manifest_id}: {e}")
+                        print(f"❌ Failed to archive depot manifest: {manifest_id}")
+                        continue
+                        
+                    if depot_result is None:
+                        print(f"   ✅ Depot manifest already exists on disk - SKIPPING: {manifest_id}")
+                        results['depot_manifests_skipped'] += 1
+                    elif depot_result['success']:
+                        results['depot_manifests_archived'] += 1
+                        print(f"✅ Successfully archived depot manifest: {manifest_id}")
+                    else:
+                        results['errors'].extend(depot_result['errors'])
+                        print(f"❌ Failed to archive depot manifest: {manifest_id}")
             
             # Save database after processing all manifests
             self.save_database()
@@ -1300,47 +2152,50 @@ class GOGGalaxyArchiver:
             results['builds_archived'] = len(archived_builds)
             
             for archived_build in archived_builds:
-                print(f"\n=== Dry Run Analysis: Build {build_id} ===")
-                print(f"Version: v{archived_build.version}")
-                print(f"Platform: {archived_build.platform}")
-                print(f"References {len(archived_build.manifests_referenced)} depot manifests")
+                # The report for a build can run to thousands of depots: collect it and write it once
+                lines = []
+                lines.append(f"\n=== Dry Run Analysis: Build {build_id} ===")
+                lines.append(f"Version: v{archived_build.version}")
+                lines.append(f"Platform: {archived_build.platform}")
+                lines.append(f"References {len(archived_build.manifests_referenced)} depot manifests")
                 
                 depot_count = 0
                 for manifest_id in archived_build.manifests_referenced:
                     depot_count += 1
-                    print(f"\n{depot_count}. Depot Manifest: {manifest_id}")
+                    lines.append(f"\n{depot_count}. Depot Manifest: {manifest_id}")
                     
                     # Check if we already have this manifest
                     if manifest_id in self.archived_manifests:
                         existing = self.archived_manifests[manifest_id]
-                        print(f"   Status: ✅ Already archived")
-                        print(f"   Files: {existing.file_count}")
-                        print(f"   Size: {existing.total_size:,} bytes ({existing.total_size / (1024**3):.2f} GB)")
+                        lines.append(f"   Status: ✅ Already archived")
+                        lines.append(f"   Files: {existing.file_count}")
+                        lines.append(f"   Size: {existing.total_size:,} bytes ({existing.total_size / (1024**3):.2f} GB)")
                         
                         # Check for blob references
                         if existing.chunks_referenced:
                             for chunk_ref in existing.chunks_referenced:
                                 if chunk_ref in self.archived_blobs:
                                     blob = self.archived_blobs[chunk_ref]
-                                    blob_path = Path(blob.archive_path)
-                                    if blob_path.exists():
-                                        print(f"   Blob: ✅ {chunk_ref} exists ({blob.total_size:,} bytes)")
+                                    if self._blob_size(blob.archive_path) is not None:
+                                        lines.append(f"   Blob: ✅ {chunk_ref} exists ({blob.total_size:,} bytes)")
                                         results['content_summary']['v1_blobs_found'] += 1
                                         results['content_summary']['estimated_blob_size'] += blob.total_size
                                     else:
-                                        print(f"   Blob: ❌ {chunk_ref} missing - would re-download")
+                                        lines.append(f"   Blob: ❌ {chunk_ref} missing - would re-download")
                         
                         if existing.version == 2 and len(existing.chunks_referenced) > 0:
                             results['content_summary']['v2_chunks_found'] += len(existing.chunks_referenced)
-                            print(f"   Chunks: {len(existing.chunks_referenced)} v2 chunks referenced")
+                            lines.append(f"   Chunks: {len(existing.chunks_referenced)} v2 chunks referenced")
                     else:
-                        print(f"   Status: DOWNLOAD - Would download and process")
+                        lines.append(f"   Status: DOWNLOAD - Would download and process")
                         if archived_build.version == 1:
-                            print(f"   Content: Would download v1 blob")
+                            lines.append(f"   Content: Would download v1 blob")
                         else:
-                            print(f"   Content: Would download v2 chunks")
+                            lines.append(f"   Content: Would download v2 chunks")
                     
                     results['manifests_processed'] += 1
+                    
+                print("\n".join(lines))
                 
         except Exception as e:
             error_msg = f"Failed to analyze build {build_id}: {e}"
@@ -1361,41 +2216,35 @@ class GOGGalaxyArchiver:
                 return None
                 
             # Save raw manifest data preserving CDN structure (this also saves prettified copy)
-            raw_path = self._save_raw_build_manifest(cdn_url, raw_data)
-            
-            # Create build hash from raw file data (more reliable than JSON content hash)
-            build_hash = hashlib.sha256(raw_data).hexdigest()
+            # Build hash comes from the raw file data (more reliable than JSON content hash)
+            raw_path, build_hash = self._save_raw_build_manifest(cdn_url, raw_data)
             
             # Convert to relative path (relative to archive_root)
-            raw_path_obj = Path(raw_path)
-            relative_path = raw_path_obj.relative_to(self.archive_root)
+            relative_path = self._archive_relative(raw_path)
                 
-            # Extract chunk references and determine content type
-            chunks_referenced = set()
-            blobs_referenced = set()
+            # Extract depot manifest references: v2 builds reference chunked depots,
+            # v1 builds blob depots, never both, so a single set is kept
             version = manifest_data.get('version', 2)
             
             if version == 2:
                 # Parse v2 manifest - extract depot manifests directly from JSON
-                for depot in manifest_data.get('depots', []):
-                    chunks_referenced.add(depot.get('manifest', ''))
+                # (depots without a manifest id are left out rather than stored as '')
+                manifests_referenced = {depot['manifest'] for depot in manifest_data.get('depots', ()) if depot.get('manifest')}
                     
                 # Also check offline depot (skip for now - offline depot chunks often fail to download)
                 if 'offlineDepot' in manifest_data:
                     self.logger.debug(f"Skipping offline depot manifest reference: {manifest_data['offlineDepot'].get('manifest', '')} (offline depots not supported)")
-                    # chunks_referenced.add(manifest_data['offlineDepot'].get('manifest', ''))
+                    # manifests_referenced.add(manifest_data['offlineDepot'].get('manifest', ''))
             else:
                 # Parse v1 manifest - extract depot manifests from product.depots
                 product_data = manifest_data.get('product', {})
-                for depot in product_data.get('depots', []):
-                    # Only add depots that have manifest (skip redist entries that don't have manifest)
-                    if 'manifest' in depot:
-                        blobs_referenced.add(depot.get('manifest', ''))
+                # Only add depots that have manifest (skip redist entries that don't have manifest)
+                manifests_referenced = {depot['manifest'] for depot in product_data.get('depots', ()) if depot.get('manifest')}
                     
                 # Also check offline depot if it exists (skip for now - offline depot chunks often fail to download)
                 if 'offlineDepot' in product_data:
                     self.logger.debug(f"Skipping offline depot manifest reference: {product_data['offlineDepot'].get('manifest', '')} (offline depots not supported)")
-                    # blobs_referenced.add(product_data['offlineDepot'].get('manifest', ''))
+                    # manifests_referenced.add(product_data['offlineDepot'].get('manifest', ''))
                 
             # Create archived build record
             archived_build = ArchivedBuild(
@@ -1404,21 +2253,22 @@ class GOGGalaxyArchiver:
                 build_hash=build_hash,
                 platform=platform,
                 version=version,
-                archive_path=str(relative_path),
+                archive_path=relative_path,
                 cdn_url=cdn_url,
                 timestamp=time.time(),
                 dependencies=manifest_data.get('dependencies', []),
-                manifests_referenced=chunks_referenced.union(blobs_referenced),  # Combine both for tracking
+                manifests_referenced=manifests_referenced,
                 repository_id=repository_id,
                 version_name=version_name,
                 tags=tags or []
             )
                 
             # Store in database
-            build_key = f"{game_id}_{build_id}_{platform}"
-            self.archived_builds[build_key] = archived_build
+            build_key = (game_id, build_id, platform)
+            with self._builds_lock:
+                self.archived_builds[build_key] = archived_build
             
-            self.logger.info(f"Archived build: {build_key} with {len(chunks_referenced)} depots and {len(blobs_referenced)} blobs")
+            self.logger.info(f"Archived build: {game_id}/{build_id}/{platform} with {len(manifests_referenced)} {'depots' if version == 2 else 'blobs'}")
             return archived_build
             
         except Exception as e:
@@ -1436,21 +2286,7 @@ class GOGGalaxyArchiver:
         try:
             # Load the build manifest to get depot manifest IDs (use absolute path)
             absolute_path = self.archive_root / archived_build.archive_path
-            with open(absolute_path, 'rb') as f:
-                raw_data = f.read()
-                
-            # Check if we need to decompress (for v2) or read as JSON (for v1)
-            if archived_build.version == 2:
-                try:
-                    # Try to decompress zlib data
-                    decompressed = zlib.decompress(raw_data, 15)
-                    build_manifest = json.loads(decompressed.decode('utf-8'))
-                except zlib.error:
-                    # Not compressed, read as plain JSON  
-                    build_manifest = json.loads(raw_data.decode('utf-8'))
-            else:
-                # v1 manifests are typically plain JSON
-                build_manifest = json.loads(raw_data.decode('utf-8'))
+            build_manifest = self._load_build_manifest(absolute_path)
             
             depot_manifests = []
             
@@ -1500,34 +2336,50 @@ class GOGGalaxyArchiver:
             self.logger.info(f"Found {len(depot_manifests)} depot manifests to process")
             
             if archived_build.version == 2:
-                # Process v2 depot manifests sequentially (existing logic)
-                for depot_info in depot_manifests:
-                    manifest_id = depot_info['manifest_id']
-                    self.logger.info(f"Processing depot manifest: {manifest_id}")
+                # Up to MANIFEST_FETCH_WORKERS depot manifests download ahead while each depot's
+                # chunks are processed in order; consumed manifests are dropped straight away,
+                # so memory stays bounded by the look-ahead window rather than the build size
+                with ThreadPoolExecutor(max_workers=MANIFEST_FETCH_WORKERS) as manifest_executor:
+                    def fetch(depot_info):
+                        return manifest_executor.submit(self._fetch_v2_depot_manifest, depot_info['manifest_id'])
                     
-                    # Download and archive v2 depot manifest and its chunks
-                    chunks_result = self._archive_v2_depot_manifest_and_chunks(
-                        archived_build.game_id, manifest_id, max_workers
-                    )
-                    results['chunks_archived'] += chunks_result['chunks_archived']
-                    results['depot_manifests_archived'] += 1 if chunks_result['success'] else 0
+                    fetches = deque(fetch(depot_info) for depot_info in depot_manifests[:MANIFEST_FETCH_WORKERS])
+                    for i, depot_info in enumerate(depot_manifests):
+                        fetched = fetches.popleft()
+                        if i + MANIFEST_FETCH_WORKERS < len(depot_manifests):
+                            fetches.append(fetch(depot_manifests[i + MANIFEST_FETCH_WORKERS]))
+                        manifest_id = depot_info['manifest_id']
+                        self.logger.info(f"Processing depot manifest: {manifest_id}")
+                        
+                        # Archive v2 depot manifest and its chunks
+                        chunks_result = self._archive_v2_depot_manifest_and_chunks(
+                            archived_build.game_id, manifest_id, max_workers, fetched
+                        )
+                        results['chunks_archived'] += chunks_result['chunks_archived']
+                        results['depot_manifests_archived'] += 1 if chunks_result['success'] else 0
+                        del fetched
             else:
                 # V1 DEDUPLICATION: Process all depot manifests first, then deduplicated blobs
                 v1_manifests_processed = 0
                 v1_depot_manifests_data = {}
                 
-                # Step 1: Download all v1 depot manifests first
+                # Step 1: Download all v1 depot manifests first, concurrently
                 self.logger.info(f"V1 DEDUPLICATION: Downloading {len(depot_manifests)} depot manifests...")
-                for depot_info in depot_manifests:
-                    manifest_id = depot_info['manifest_id']
+                manifest_ids = [depot_info['manifest_id'] for depot_info in depot_manifests]
+                
+                def download_manifest(manifest_id):
                     self.logger.info(f"Downloading v1 depot manifest: {manifest_id}")
-                    
                     # Download depot manifest only (no blob yet)
-                    manifest_result = self._download_v1_depot_manifest_only(
+                    return self._download_v1_depot_manifest_only(
                         archived_build.game_id, archived_build.platform, archived_build.build_id, 
                         archived_build.repository_id, manifest_id
                     )
                     
+                # map() keeps the results in build manifest order
+                with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(manifest_ids)))) as executor:
+                    manifest_results = list(executor.map(download_manifest, manifest_ids))
+                    
+                for manifest_id, manifest_result in zip(manifest_ids, manifest_results):
                     if manifest_result['success']:
                         v1_manifests_processed += 1
                         v1_depot_manifests_data[manifest_id] = manifest_result['depot_manifest_data']
@@ -1545,6 +2397,21 @@ class GOGGalaxyArchiver:
                             
                 self.logger.info(f"V1 DEDUPLICATION: Found {len(unique_blob_urls)} unique blob URLs across {len(v1_depot_manifests_data)} depot manifests")
                 
+                # Resolve the CDN URL once: every blob of the build shares the same
+                # secure link, so the size checks can then run together
+                blob_cdn_url = self._get_v1_blob_url(
+                    archived_build.game_id, archived_build.platform, archived_build.repository_id
+                )
+                if blob_cdn_url is None and unique_blob_urls:
+                    error_msg = f"Failed to get secure link for v1 blobs of {archived_build.build_id}"
+                    self.logger.error(error_msg)
+                    results['errors'].append(error_msg)
+                    unique_blob_urls = set()
+                blob_cdn_urls = {blob_url: blob_cdn_url for blob_url in unique_blob_urls}
+                
+                # Get expected sizes from the server via HEAD requests, issued concurrently
+                expected_sizes = self._head_content_lengths(set(blob_cdn_urls.values()))
+                
                 # Step 3: Download each unique blob using the working download method
                 for blob_url in unique_blob_urls:
                     self.logger.info(f"Downloading deduplicated v1 blob: {blob_url}")
@@ -1552,49 +2419,21 @@ class GOGGalaxyArchiver:
                     # Use the existing working download method instead of a separate deduplication method
                     blob_path = self.blobs_dir / archived_build.build_id / "main.bin"
                     
-                    # Get expected size from server via HEAD request first
-                    # from gogdl.dl import dl_utils
-                    secure_links = dl_utils.get_secure_link(
-                        self.api_handler, f"/{archived_build.platform}/{archived_build.repository_id}/", archived_build.game_id, generation=1
-                    )
-                    
-                    if isinstance(secure_links, str):
-                        blob_cdn_url = f"{secure_links}/main.bin"
-                    else:
-                        endpoint = secure_links[0].copy()
-                        endpoint["parameters"]["path"] += "/main.bin"
-                        blob_cdn_url = dl_utils.merge_url_with_params(
-                            endpoint["url_format"], endpoint["parameters"]
-                        )
+                    blob_cdn_url = blob_cdn_urls[blob_url]
+                    expected_size = expected_sizes[blob_cdn_url]
                     
-                    head_response = self.api_handler.session.head(blob_cdn_url, timeout=30)
-                    expected_size = int(head_response.headers.get('Content-Length', 0))
-                    
-                    # Check if we already have this blob complete (deduplication check with size validation)
-                    if blob_path.exists():
-                        actual_size = blob_path.stat().st_size
-                        self.logger.info(f"Found existing blob file: {blob_path} ({actual_size:,} bytes)")
-                        
-                        # Only skip if file size matches expected size from server
-                        if expected_size > 0 and actual_size == expected_size:
-                            self.logger.info(f"✅ V1 blob {blob_url} already exists and is complete:")
-                            self.logger.info(f"  File: {blob_path}")
-                            self.logger.info(f"  Size: {actual_size:,} bytes ({actual_size / (1024**3):.2f} GB)")
-                            self.logger.info(f"  Server: {expected_size:,} bytes - ✅ Size matches!")
-                            self.logger.info(f"  SKIPPING download to avoid re-download")
-                            results['blobs_archived'] += 1
-                            continue
-                        elif actual_size == 0:
-                            self.logger.info(f"⚠️  Blob file exists but is empty (0 bytes) - will download")
-                        elif expected_size > 0 and actual_size != expected_size:
-                            self.logger.info(f"⚠️  Blob size mismatch:")
-                            self.logger.info(f"  Actual: {actual_size:,} bytes ({actual_size / (1024**3):.2f} GB)")
-                            self.logger.info(f"  Expected: {expected_size:,} bytes ({expected_size / (1024**3):.2f} GB)")
-                            self.logger.info(f"  Will resume/redownload to correct size")
-                        else:
-                            self.logger.info(f"⚠️  Cannot verify size (server returned {expected_size}) - will download/resume")
+                    # Check if we already have this blob complete (deduplication check with size validation):
+                    # one cached stat against the size from the batched HEAD pass
+                    actual_size = self._blob_size(blob_path)
+                    if expected_size > 0 and actual_size == expected_size:
+                        self.logger.info("✅ V1 blob %s already complete: %s (%d bytes) - skipping", blob_url, blob_path, actual_size)
+                        results['blobs_archived'] += 1
+                        continue
+                    if actual_size is not None:
+                        self.logger.info("⚠️  Blob %s is %d bytes, server reports %d - will download/resume", blob_path, actual_size, expected_size)
                     
-                    # Use the existing working download method
+                    # Use the existing working download method (the blob changes on disk, successful or not)
+                    self._forget_blob_stat(blob_path)
                     if self._download_v1_blob_with_resume(archived_build.game_id, archived_build.platform, 
                                                         archived_build.repository_id, archived_build.build_id, 
                                                         blob_path, expected_size):
@@ -1643,96 +2482,84 @@ class GOGGalaxyArchiver:
         
         return results
         
-    def _archive_v2_depot_manifest_and_chunks(self, game_id: str, manifest_id: str, max_workers: int = 4) -> Dict:
-        """Download and archive a v2 depot manifest and all its chunks"""
+    def _fetch_v2_depot_manifest(self, manifest_id: str) -> Tuple[Optional[bytes], Optional[bytes], Optional[str]]:
+        """Download a v2 depot manifest body, inflating it as it arrives
+        
+        Returns (raw_data, decompressed, depot_url), all None if no URL worked.
+        decompressed is None when the body is not a zlib stream; see _inflate_stream().
+        """
+        # Build depot manifest URL - v2 depot manifests are under /meta/ with galaxy_path structure
+        galaxy_path = _galaxy_path(manifest_id)
+        
+        # Try multiple URL patterns for depot manifests
+        depot_urls_to_try = [
+            # New pattern (downloadable-manifests-collector)
+            f"{constants.GOG_MANIFESTS_COLLECTOR}/manifests/depots/{galaxy_path}",
+            # Old pattern (gog-cdn-fastly)
+            f"{constants.GOG_CDN}/content-system/v2/meta/{galaxy_path}",
+            # Alternative new pattern
+            f"{constants.GOG_MANIFESTS_COLLECTOR}/depots/{galaxy_path}"
+        ]
+        
+        # Try every URL pattern at once and keep the first one (in list order) that works
+        raw_response, depot_url = self._probe_urls(depot_urls_to_try)
+        
+        if not raw_response or not raw_response.ok:
+            return None, None, None
+        raw_data, decompressed = _inflate_stream(raw_response)
+        return raw_data, decompressed, depot_url
+        
+    def _summarize_v2_depot_manifest(self, raw_path: str, decompressed: bytes) -> Tuple[int, int, Set[str]]:
+        """Parse a decompressed v2 depot manifest into (file count, total size, chunk compressedMd5s)
+        
+        Writes the pretty copy when enabled. Large manifests are streamed
+        through ijson (when installed) instead of decoded whole, unless a pretty
+        copy needs the full document anyway.
+        """
+        if ijson and not self.prettify and len(decompressed) > STREAM_PARSE_MIN_SIZE:
+            return _summarize_depot_files(ijson.items(io.BytesIO(decompressed), 'depot.items.item'))
+        
+        depot_manifest = _json_loads(decompressed)
+        
+        # Save prettified depot manifest for human reading
+        if self.prettify:
+            self._write_pretty_depot_manifest(raw_path, depot_manifest)
+        # compressedMd5 is what chunk URLs and storage use
+        return _summarize_depot_files(depot_manifest.get('depot', {}).get('items', []))
+        
+    def _archive_v2_depot_manifest_and_chunks(self, game_id: str, manifest_id: str, max_workers: int = 4,
+                                              fetched=None) -> Dict:
+        """Download and archive a v2 depot manifest and all its chunks
+        
+        fetched: optional future resolving to _fetch_v2_depot_manifest(manifest_id),
+        for callers that download several manifests ahead.
+        """
         result = {'success': False, 'chunks_archived': 0, 'errors': []}
         
         try:
-            # Build depot manifest URL - v2 depot manifests are under /meta/ with galaxy_path structure
-            galaxy_path = manifest_id
-            if "/" not in galaxy_path:
-                galaxy_path = manifest_id[0:2] + "/" + manifest_id[2:4] + "/" + manifest_id
-            
-            # Try multiple URL patterns for depot manifests
-            depot_urls_to_try = [
-                # New pattern (downloadable-manifests-collector)
-                f"{constants.GOG_MANIFESTS_COLLECTOR}/manifests/depots/{galaxy_path}",
-                # Old pattern (gog-cdn-fastly)
-                f"{constants.GOG_CDN}/content-system/v2/meta/{galaxy_path}",
-                # Alternative new pattern
-                f"{constants.GOG_MANIFESTS_COLLECTOR}/depots/{galaxy_path}"
-            ]
-            
-            raw_response = None
-            depot_url = None
-            
-            # Try each URL until one works
-            for url_to_try in depot_urls_to_try:
-                print(f"DEBUG: Trying depot manifest URL: {url_to_try}")
-                try:
-                    test_response = self.api_handler.session.get(url_to_try)
-                    if test_response.ok:
-                        raw_response = test_response
-                        depot_url = url_to_try
-                        print(f"DEBUG: SUCCESS - Found depot manifest at: {depot_url}")
-                        break
-                    else:
-                        print(f"DEBUG: FAILED - {url_to_try} returned {test_response.status_code}")
-                except Exception as e:
-                    print(f"DEBUG: ERROR - {url_to_try} failed with: {e}")
-                    continue
+            if fetched is not None:
+                raw_data, decompressed_data, depot_url = fetched.result()
+            else:
+                raw_data, decompressed_data, depot_url = self._fetch_v2_depot_manifest(manifest_id)
             
-            if not raw_response or not raw_response.ok:
+            if raw_data is None:
                 result['errors'].append(f"Failed to download depot manifest {manifest_id} from any URL pattern")
                 return result
-                
-            raw_data = raw_response.content
             
             # Save raw depot manifest
             raw_path = self._save_raw_depot_manifest(depot_url, raw_data)
             
-            # Decompress and parse depot manifest
+            # Decompress and parse depot manifest, then collect the archived manifest record fields
             try:
-                import gzip
-                # Check for gzip first (starts with 0x1f 0x8b)
-                if raw_data.startswith(b'\x1f\x8b'):
-                    decompressed_data = gzip.decompress(raw_data)
-                    depot_manifest = json.loads(decompressed_data.decode('utf-8'))
-                # Check for zlib compression (starts with 0x78)
-                elif raw_data.startswith(b'\x78'):
-                    decompressed_data = zlib.decompress(raw_data, 15)
-                    depot_manifest = json.loads(decompressed_data.decode('utf-8'))
-                else:
-                    # Try as plain JSON
-                    depot_manifest = json.loads(raw_data.decode('utf-8'))
+                if decompressed_data is None:
+                    decompressed_data = _decompress_manifest(raw_data)
+                file_count, total_size, chunks_referenced = self._summarize_v2_depot_manifest(raw_path, decompressed_data)
             except Exception as e:
                 result['errors'].append(f"Failed to parse depot manifest {manifest_id}: {e}")
                 return result
             
-            # Save prettified depot manifest for human reading
-            raw_path_obj = Path(raw_path)
-            pretty_path = raw_path_obj.parent / f"{raw_path_obj.name}.json"
-            with open(pretty_path, 'w') as f:
-                json.dump(depot_manifest, f, indent=2)
-                
-            # Create archived manifest record
-            chunks_referenced = set()
-            file_count = 0
-            total_size = 0
-            
-            depot_data = depot_manifest.get('depot', {})
-            for file_record in depot_data.get('items', []):
-                if file_record.get('type') == 'DepotFile':  # Only count files, not directories
-                    file_count += 1
-                    total_size += file_record.get('size', 0)
-                    for chunk in file_record.get('chunks', []):
-                        chunk_md5 = chunk.get('compressedMd5')  # Use compressedMd5 for URLs and storage
-                        if chunk_md5:
-                            chunks_referenced.add(chunk_md5)
-            
             # Convert to relative path
-            raw_path_obj = Path(raw_path)
-            relative_path = raw_path_obj.relative_to(self.archive_root)
+            relative_path = self._archive_relative(raw_path)
             
             archived_manifest = ArchivedManifest(
                 manifest_id=manifest_id,
@@ -1740,7 +2567,7 @@ class GOGGalaxyArchiver:
                 version=2,
                 manifest_type='depot',
                 languages=['*'],  # TODO: Extract from build context
-                archive_path=str(relative_path),
+                archive_path=relative_path,
                 cdn_url=depot_url,
                 timestamp=time.time(),
                 file_count=file_count,
@@ -1769,100 +2596,104 @@ class GOGGalaxyArchiver:
             
         return result
         
+    def _head_content_lengths(self, urls) -> Dict[str, int]:
+        """HEAD each URL concurrently and map it to its Content-Length (0 when not sent)"""
+        urls = list(urls)
+        if not urls:
+            return {}
+        
+        def content_length(url):
+            head_response = self.api_handler.session.head(url, timeout=30)
+            return int(head_response.headers.get('Content-Length', 0))
+            
+        with ThreadPoolExecutor(max_workers=min(len(urls), MANIFEST_FETCH_WORKERS)) as executor:
+            return dict(zip(urls, executor.map(content_length, urls)))
+        
+    def _probe_urls(self, urls: List[str]):
+        """GET all candidate URLs concurrently; return (response, url) for the first that is ok
+        
+        Candidates earlier in the list win when several succeed. Returns (None, None)
+        when none do. Only the winning body is read; the others are closed unread.
+        """
+        responses = [None] * len(urls)
+        with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+            futures = {executor.submit(self.api_handler.session.get, url, stream=True): i for i, url in enumerate(urls)}
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    responses[i] = future.result()
+                except Exception as e:
+                    self.logger.debug(f"Depot manifest URL {urls[i]} failed with: {e}")
+                    continue
+                if not responses[i].ok:
+                    self.logger.debug(f"Depot manifest URL {urls[i]} returned {responses[i].status_code}")
+                    
+        winner = next((i for i, response in enumerate(responses) if response is not None and response.ok), None)
+        for i, response in enumerate(responses):
+            if response is not None and i != winner:
+                response.close()
+        if winner is None:
+            return None, None
+        self.logger.debug(f"Found depot manifest at: {urls[winner]}")
+        return responses[winner], urls[winner]
+        
+    def _fetch_depot_manifest_only(self, game_id: str, manifest_id: str, version: int, platform: str,
+                                   repository_id: str, build_id: str) -> Optional[Dict]:
+        """Download one depot manifest (no chunks/blobs) unless it is already on disk
+        
+        Returns the download result, or None when the manifest was skipped.
+        """
+        # Check if we already have this depot manifest on disk
+        if self._depot_manifest_on_disk(game_id, manifest_id, version, platform, repository_id):
+            return None
+        if version == 2:
+            return self._download_v2_depot_manifest_only(game_id, manifest_id)
+        return self._download_v1_depot_manifest_only(game_id, platform, build_id, repository_id, manifest_id)
+        
+    def _depot_manifest_on_disk(self, game_id: str, manifest_id: str, version: int, platform: str,
+                                repository_id: str) -> bool:
+        """Whether a depot manifest is already archived (v2: scanned set, v1: one exists())"""
+        if version == 2:
+            galaxy_path = _galaxy_path(manifest_id)
+            return galaxy_path in self._existing_v2_depot_manifests()
+        return os.path.exists(os.path.join(self._v1_depot_manifests_root, game_id, platform, repository_id, manifest_id))
+        
     def _download_v2_depot_manifest_only(self, game_id: str, manifest_id: str) -> Dict:
         """Download and archive a v2 depot manifest only - skip chunks"""
         result = {'success': False, 'errors': []}
         
         try:
             # Build depot manifest URL - v2 depot manifests are under /meta/ with galaxy_path structure
-            galaxy_path = manifest_id
-            if "/" not in galaxy_path:
-                galaxy_path = manifest_id[0:2] + "/" + manifest_id[2:4] + "/" + manifest_id
+            galaxy_path = _galaxy_path(manifest_id)
             
-            # Check if we already have this depot manifest on disk
-            depot_path = self.archive_root / "manifests" / "v2" / "depots" / galaxy_path
-            meta_path = self.archive_root / "manifests" / "v2" / "meta" / galaxy_path
-            
-            if depot_path.exists() or meta_path.exists():
+            # Check if we already have this depot manifest on disk (depots or meta tree)
+            if galaxy_path in self._existing_v2_depot_manifests():
                 result['success'] = True
                 result['already_exists'] = True
                 return result
             
-            # Try multiple URL patterns for depot manifests
-            depot_urls_to_try = [
-                # New pattern (downloadable-manifests-collector)
-                f"{constants.GOG_MANIFESTS_COLLECTOR}/manifests/depots/{galaxy_path}",
-                # Old pattern (gog-cdn-fastly)
-                f"{constants.GOG_CDN}/content-system/v2/meta/{galaxy_path}",
-                # Alternative new pattern
-                f"{constants.GOG_MANIFESTS_COLLECTOR}/depots/{galaxy_path}"
-            ]
-            
-            raw_response = None
-            depot_url = None
-            
-            # Try each URL until one works
-            for url_to_try in depot_urls_to_try:
-                try:
-                    test_response = self.api_handler.session.get(url_to_try)
-                    if test_response.ok:
-                        raw_response = test_response
-                        depot_url = url_to_try
-                        break
-                except Exception as e:
-                    continue
+            # Download the manifest, inflating zlib bodies as they arrive
+            raw_data, decompressed, depot_url = self._fetch_v2_depot_manifest(manifest_id)
             
-            if not raw_response or not raw_response.ok:
+            if raw_data is None:
                 result['errors'].append(f"Failed to download depot manifest {manifest_id} from any URL pattern")
                 return result
-                
-            raw_data = raw_response.content
             
             # Save raw depot manifest
             raw_path = self._save_raw_depot_manifest(depot_url, raw_data)
             
-            # Decompress and parse depot manifest
+            # Decompress (gzip or plain bodies) and parse depot manifest, collecting
+            # the archived manifest record fields (chunk references but no downloads)
             try:
-                import gzip
-                # Check for gzip first (starts with 0x1f 0x8b)
-                if raw_data.startswith(b'\x1f\x8b'):
-                    decompressed_data = gzip.decompress(raw_data)
-                    depot_manifest = json.loads(decompressed_data.decode('utf-8'))
-                # Check for zlib compression (starts with 0x78)
-                elif raw_data.startswith(b'\x78'):
-                    decompressed_data = zlib.decompress(raw_data, 15)
-                    depot_manifest = json.loads(decompressed_data.decode('utf-8'))
-                else:
-                    # Try as plain JSON
-                    depot_manifest = json.loads(raw_data.decode('utf-8'))
+                if decompressed is None:
+                    decompressed = _decompress_manifest(raw_data)
+                file_count, total_size, chunks_referenced = self._summarize_v2_depot_manifest(raw_path, decompressed)
             except Exception as e:
                 result['errors'].append(f"Failed to parse depot manifest {manifest_id}: {e}")
                 return result
             
-            # Save prettified depot manifest for human reading
-            raw_path_obj = Path(raw_path)
-            pretty_path = raw_path_obj.parent / f"{raw_path_obj.name}.json"
-            with open(pretty_path, 'w') as f:
-                json.dump(depot_manifest, f, indent=2)
-                
-            # Create archived manifest record (collect chunk references but don't download them)
-            chunks_referenced = set()
-            file_count = 0
-            total_size = 0
-            
-            depot_data = depot_manifest.get('depot', {})
-            for file_record in depot_data.get('items', []):
-                if file_record.get('type') == 'DepotFile':  # Only count files, not directories
-                    file_count += 1
-                    total_size += file_record.get('size', 0)
-                    for chunk in file_record.get('chunks', []):
-                        chunk_md5 = chunk.get('compressedMd5')  # Use compressedMd5 for URLs and storage
-                        if chunk_md5:
-                            chunks_referenced.add(chunk_md5)
-            
             # Convert to relative path
-            raw_path_obj = Path(raw_path)
-            relative_path = raw_path_obj.relative_to(self.archive_root)
+            relative_path = self._archive_relative(raw_path)
             
             archived_manifest = ArchivedManifest(
                 manifest_id=manifest_id,
@@ -1870,7 +2701,7 @@ class GOGGalaxyArchiver:
                 version=2,
                 manifest_type='depot',
                 languages=['*'],  # TODO: Extract from build context
-                archive_path=str(relative_path),
+                archive_path=relative_path,
                 cdn_url=depot_url,
                 timestamp=time.time(),
                 file_count=file_count,
@@ -1913,18 +2744,23 @@ class GOGGalaxyArchiver:
                 result['already_exists'] = True
                 return result
             
-            # Download depot manifest  
-            # from gogdl.dl import dl_utils
-            depot_manifest = dl_utils.get_json(self.api_handler, depot_url)
+            # Download depot manifest: the body is kept as bytes and parsed once
+            # (orjson when installed) instead of parsed by requests and re-serialized
+            response = self.api_handler.session.get(depot_url, headers={"Accept": "application/json"})
+            depot_manifest = None
+            if response.ok:
+                raw_data = response.content
+                try:
+                    depot_manifest = _json_loads(raw_data)
+                except ValueError:
+                    pass
             if not depot_manifest:
                 result['errors'].append(f"Failed to download v1 depot manifest {manifest_id}")
                 return result
             
-            self.logger.info(f"Successfully downloaded V1 depot manifest {manifest_id}, size: {len(str(depot_manifest))} chars")
+            self.logger.info(f"Successfully downloaded V1 depot manifest {manifest_id}, size: {len(raw_data)} bytes")
             
-            # Save raw depot manifest (as JSON since v1 isn't compressed)
-            raw_data = json.dumps(depot_manifest).encode('utf-8')
-            self.logger.info(f"About to save raw depot manifest to archive, raw_data size: {len(raw_data)} bytes")
+            # Save raw depot manifest (v1 isn't compressed, so these are the CDN bytes as served)
             raw_path = self._save_raw_depot_manifest(depot_url, raw_data)
             self.logger.info(f"Raw depot manifest saved to: {raw_path}")
             
@@ -1935,7 +2771,7 @@ class GOGGalaxyArchiver:
                 version=1,
                 manifest_type="depot",
                 languages=["English"],  # Default, could be extracted from depot if needed
-                archive_path=str(Path(raw_path).relative_to(self.archive_root)),
+                archive_path=self._archive_relative(raw_path),
                 cdn_url=depot_url,
                 timestamp=time.time(),
                 file_count=len(depot_manifest.get("depot", {}).get("files", [])),
@@ -1981,7 +2817,7 @@ class GOGGalaxyArchiver:
     #             result['errors'].append(f"Failed to download v1 depot manifest {manifest_id}")
     #             return result
             
-    #         self.logger.info(f"Successfully downloaded V1 depot manifest {manifest_id}, size: {len(str(depot_manifest))} chars")
+    #         self.logger.info(f"Successfully downloaded V1 depot manifest {manifest_id}")
             
     #         # Save raw depot manifest (as JSON since v1 isn't compressed)
     #         raw_data = json.dumps(depot_manifest).encode('utf-8')
@@ -2274,7 +3110,6 @@ class GOGGalaxyArchiver:
 
     def _generate_blob_checksum_xml(self, blob_path: Path, expected_size: int) -> bool:
         """Generate checksum files (both XML and JSON) for a blob with 100 MiB chunks"""
-        from datetime import datetime
 
         # Both XML and JSON file paths - for compatibility/migration
         xml_path = blob_path.with_suffix('.xml')
@@ -2287,35 +3122,36 @@ class GOGGalaxyArchiver:
             
             self.logger.info(f"🧮 Generating checksums for {blob_path.name}: {total_chunks} chunks of 100 MiB each")
             
-            # Open blob file for reading
+            chunks_data = []
+            overall_md5 = hashlib.md5()
+            overall_sha1 = hashlib.sha1()
+            overall_sha256 = hashlib.sha256()
+            
+            # Map the blob read-only: chunks are hashed straight from the page cache
+            # through memoryview slices instead of being read into 100 MiB bytes objects
             with open(blob_path, 'rb') as f:
-                chunks_data = []
-                overall_md5 = hashlib.md5()
-                overall_sha1 = hashlib.sha1()
-                overall_sha256 = hashlib.sha256()
+                file_size = os.fstat(f.fileno()).st_size
+                if file_size < expected_size:
+                    self.logger.error(f"Failed to read {blob_path.name}: got {file_size} bytes, expected {expected_size}")
+                    return False
+                if hasattr(os, 'posix_fadvise'):
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                # (an empty file can't be mapped; it has no chunks to hash either)
+                mapping = _map_readonly(f, file_size)
                 
-                for chunk_id in range(total_chunks):
-                    chunk_start = chunk_id * chunk_size
-                    chunk_end = min(chunk_start + chunk_size - 1, expected_size - 1)
-                    actual_chunk_size = chunk_end - chunk_start + 1
-                    
-                    # Read chunk data
-                    f.seek(chunk_start)
-                    chunk_data = f.read(actual_chunk_size)
-                    
-                    if len(chunk_data) != actual_chunk_size:
-                        self.logger.error(f"Failed to read chunk {chunk_id}: got {len(chunk_data)} bytes, expected {actual_chunk_size}")
-                        return False
-                    
+            # Chunk checksums are independent, so they run on a thread pool alongside the
+            # overall checksums; each of those is a single update over the whole mapping
+            with mapping as mm, memoryview(mm) as mv, \
+                    ThreadPoolExecutor(max_workers=CHECKSUM_WORKERS, thread_name_prefix="checksum") as executor:
+                overall_futures = [executor.submit(_feed_hash, running, mv[:expected_size])
+                                   for running in (overall_md5, overall_sha1, overall_sha256)]
+                ranges = [(start, min(start + chunk_size, expected_size)) for start in range(0, expected_size, chunk_size)]
+                futures = [executor.submit(_chunk_digests, mv[start:end]) for start, end in ranges]
+                
+                for chunk_id, ((chunk_start, end), future) in enumerate(zip(ranges, futures)):
+                    chunk_end = end - 1
                     # Calculate chunk checksums (all three types)
-                    chunk_md5 = hashlib.md5(chunk_data).hexdigest()
-                    chunk_sha1 = hashlib.sha1(chunk_data).hexdigest()
-                    chunk_sha256 = hashlib.sha256(chunk_data).hexdigest()
-                    
-                    # Update overall checksums
-                    overall_md5.update(chunk_data)
-                    overall_sha1.update(chunk_data)
-                    overall_sha256.update(chunk_data)
+                    chunk_md5, chunk_sha1, chunk_sha256 = future.result()
                     
                     chunks_data.append({
                         'id': chunk_id,
@@ -2330,6 +3166,9 @@ class GOGGalaxyArchiver:
                     if (chunk_id + 1) % 10 == 0 or chunk_id == total_chunks - 1:
                         progress = ((chunk_id + 1) / total_chunks) * 100
                         self.logger.info(f"   📊 Checksum progress: {chunk_id + 1}/{total_chunks} chunks ({progress:.1f}%)")
+                        
+                for future in overall_futures:
+                    future.result()
             
             # Generate overall hash values
             overall_md5_hex = overall_md5.hexdigest()
@@ -2338,18 +3177,17 @@ class GOGGalaxyArchiver:
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             iso_timestamp = datetime.now().isoformat()
             
-            # Generate XML content (for lgogdownloader compatibility)
-            xml_content = f'<file name="{blob_path.name}" available="1" notavailablemsg="" md5="{overall_md5_hex}" sha1="{overall_sha1_hex}" sha256="{overall_sha256_hex}" chunks="{total_chunks}" timestamp="{timestamp}" total_size="{expected_size}">\n'
+            # Generate XML content (for lgogdownloader compatibility), joined once at the end
+            xml_parts = [f'<file name="{blob_path.name}" available="1" notavailablemsg="" md5="{overall_md5_hex}" sha1="{overall_sha1_hex}" sha256="{overall_sha256_hex}" chunks="{total_chunks}" timestamp="{timestamp}" total_size="{expected_size}">\n']
             
             for chunk in chunks_data:
                 # Single line with all hash methods as attributes (compact format)
-                xml_content += f'\t<chunk id="{chunk["id"]}" from="{chunk["from"]}" to="{chunk["to"]}" md5="{chunk["md5"]}" sha1="{chunk["sha1"]}" sha256="{chunk["sha256"]}" />\n'
+                xml_parts.append(f'\t<chunk id="{chunk["id"]}" from="{chunk["from"]}" to="{chunk["to"]}" md5="{chunk["md5"]}" sha1="{chunk["sha1"]}" sha256="{chunk["sha256"]}" />\n')
             
-            xml_content += '</file>\n'
+            xml_parts.append('</file>\n')
             
             # Write XML file
-            with open(xml_path, 'w', encoding='utf-8') as f:
-                f.write(xml_content)
+            _write_file(xml_path, ''.join(xml_parts).encode('utf-8'))
             
             # Generate JSON content (for improved parsing and future use)
             json_data = {
@@ -2379,8 +3217,7 @@ class GOGGalaxyArchiver:
                 }
             
             # Write JSON file
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(json_data, f, indent=2, sort_keys=True)
+            _write_file(json_path, _pretty_json(json_data, sort_keys=True))
             
             self.logger.info(f"✅ Generated checksum files:")
             self.logger.info(f"   📋 XML: {xml_path}")
@@ -2399,25 +3236,16 @@ class GOGGalaxyArchiver:
     def _download_v1_blob_with_resume(self, game_id: str, platform: str, repository_id: str, 
                                   build_id: str, blob_path: Path, expected_size: int) -> bool:
         """Download v1 blob with block-based resume capability"""
-        from datetime import datetime
 
         chunk_size = 100 * 1024 * 1024  # 100 MiB chunks
         json_path = blob_path.with_suffix('.json')
     
         try:
-            # Get secure links for download
-            secure_links = dl_utils.get_secure_link(
-                self.api_handler, f"/{platform}/{repository_id}/", game_id, generation=1
-            )
-        
-            if isinstance(secure_links, str):
-                blob_url = f"{secure_links}/main.bin"
-            else:
-                endpoint = secure_links[0].copy()
-                endpoint["parameters"]["path"] += "/main.bin"
-                blob_url = dl_utils.merge_url_with_params(
-                    endpoint["url_format"], endpoint["parameters"]
-                )
+            # Secure link is cached per repository, so resuming blobs of one build reuses it
+            blob_url = self._get_v1_blob_url(game_id, platform, repository_id)
+            if not blob_url:
+                self.logger.error(f"Failed to get secure link for v1 blob of {build_id}")
+                return False
         
             # Calculate chunks needed
             total_chunks = (expected_size + chunk_size - 1) // chunk_size
@@ -2434,14 +3262,14 @@ class GOGGalaxyArchiver:
                 # Parse JSON to get both chunk hashes and validation states
                 existing_chunk_states = {}
                 try:
-                    with open(json_path, 'r', encoding='utf-8') as f:
-                        json_data = json.load(f)
+                    json_data = _json_loads(json_path.read_bytes())
                     existing_chunk_states = json_data.get('chunk_states', {})
                 except Exception as e:
                     self.logger.warning(f"Failed to parse chunk states from JSON: {e}")
                 
-                # Validate existing chunks intelligently based on their validation state
-                with open(blob_path, 'rb') as f:
+                # Validate existing chunks intelligently based on their validation state,
+                # hashing straight from a read-only mapping of the partial blob
+                with _mapped_view(blob_path) as mv:
                     for chunk_id in range(total_chunks):
                         chunk_start = chunk_id * chunk_size
                         chunk_end = min(chunk_start + chunk_size - 1, expected_size - 1)
@@ -2459,30 +3287,17 @@ class GOGGalaxyArchiver:
                             
                             # Chunk exists but not validated - perform validation
                             self.logger.info(f"   🔍 Validating chunk {chunk_id}...")
-                            f.seek(chunk_start)
-                            chunk_data = f.read(actual_chunk_size)
-                            
-                            # Skip validation if chunk appears to be zero-filled (incomplete download)
-                            if chunk_data == b'\x00' * actual_chunk_size:
+                            with mv[chunk_start:chunk_end + 1] as chunk_data:
+                                # Skip validation if chunk appears to be zero-filled (incomplete download)
+                                zero_filled = chunk_data == bytes(actual_chunk_size)
+                                # Try to validate with available hash methods (prefer strongest)
+                                chunk_valid = not zero_filled and _chunk_matches(chunk_data, existing_chunks[chunk_id])
+                                
+                            if zero_filled:
                                 self.logger.warning(f"   ⚠️  Chunk {chunk_id} appears zero-filled, will re-download")
                                 chunks_to_download.append(chunk_id)
                                 continue
                             
-                            # Try to validate with available hash methods (prefer strongest)
-                            chunk_valid = False
-                            if 'sha256' in existing_chunks[chunk_id]:
-                                chunk_sha256 = hashlib.sha256(chunk_data).hexdigest()
-                                if chunk_sha256 == existing_chunks[chunk_id]['sha256']:
-                                    chunk_valid = True
-                            elif 'sha1' in existing_chunks[chunk_id]:
-                                chunk_sha1 = hashlib.sha1(chunk_data).hexdigest()
-                                if chunk_sha1 == existing_chunks[chunk_id]['sha1']:
-                                    chunk_valid = True
-                            elif 'md5' in existing_chunks[chunk_id]:
-                                chunk_md5 = hashlib.md5(chunk_data).hexdigest()
-                                if chunk_md5 == existing_chunks[chunk_id]['md5']:
-                                    chunk_valid = True
-                            
                             if chunk_valid:
                                 # Mark as validated with current timestamp, preserve existing download_time
                                 validation_time = datetime.now().isoformat()
@@ -2531,129 +3346,139 @@ class GOGGalaxyArchiver:
             # Pre-populate overall hashes with existing validated chunks
             if existing_chunks and blob_path.exists():
                 self.logger.info("🔄 Pre-loading overall hashes from existing chunks...")
-                with open(blob_path, 'rb') as f:
+                with _mapped_view(blob_path, drop_cache=True) as mv:
                     for chunk_id in sorted(existing_chunks.keys()):
                         chunk_start = existing_chunks[chunk_id]['from']
                         chunk_end = existing_chunks[chunk_id]['to']
-                        actual_chunk_size = chunk_end - chunk_start + 1
-                        
-                        f.seek(chunk_start)
-                        chunk_data = f.read(actual_chunk_size)
                         
                         # Add existing chunk to running overall hashes
-                        overall_md5.update(chunk_data)
-                        overall_sha1.update(chunk_data)
-                        overall_sha256.update(chunk_data)
+                        with mv[chunk_start:chunk_end + 1] as chunk_data:
+                            overall_md5.update(chunk_data)
+                            overall_sha1.update(chunk_data)
+                            overall_sha256.update(chunk_data)
         
-            # Download missing/corrupted chunks with incremental JSON updates
-            for i, chunk_id in enumerate(chunks_to_download):
+            def chunk_range(chunk_id: int) -> Tuple[int, int]:
                 chunk_start = chunk_id * chunk_size
-                chunk_end = min(chunk_start + chunk_size - 1, expected_size - 1)
-                actual_chunk_size = chunk_end - chunk_start + 1
+                return chunk_start, min(chunk_start + chunk_size - 1, expected_size - 1)
+            
+            # Several ranges download concurrently while the oldest one is hashed and written;
+            # chunks are still processed in order, so at most BLOB_RANGE_WORKERS + 1 are in memory
+            fetcher = ThreadPoolExecutor(max_workers=BLOB_RANGE_WORKERS, thread_name_prefix="blob-fetch")
+            fetch_stop = threading.Event()
+            
+            def fetch(chunk_id: int):
+                return fetcher.submit(self._fetch_blob_range, blob_url, *chunk_range(chunk_id), stop=fetch_stop)
+            
+            pending = deque(fetch(chunk_id) for chunk_id in chunks_to_download[:BLOB_RANGE_WORKERS])
+            blob_fd = None
+            # Downloaded chunks not yet recorded in the JSON file, see BLOB_JSON_FLUSH_CHUNKS
+            unflushed = set()
+            last_flush = time.monotonic()
+            # Overall hash state as of the last downloaded chunk (None until one is done)
+            incremental_hashes = None
+            
+            def save_progress():
+                # Record the chunks downloaded so far before bailing out; the incremental
+                # hashes spare the fallback that re-hashes the whole blob from disk
+                self._update_json_with_current_chunks(json_path, blob_path, expected_size, total_chunks,
+                                                     existing_chunks, incremental_hashes, unflushed)
             
-                self.logger.info(f"📥 [{i+1}/{len(chunks_to_download)}] Downloading chunk {chunk_id} ({chunk_start}-{chunk_end}, {actual_chunk_size:,} bytes)")
-            
-                try:
-                    # HTTP Range request for this chunk
-                    headers = {'Range': f'bytes={chunk_start}-{chunk_end}'}
-                    response = self.api_handler.session.get(blob_url, headers=headers, stream=True, timeout=(30, 300))
-                
-                    if response.status_code not in (206, 200):  # 206 = Partial Content, 200 = OK (full file)
-                        self.logger.error(f"Range request failed for chunk {chunk_id}: HTTP {response.status_code}")
-                        # Update JSON with current progress before failing
-                        self._update_json_with_current_chunks(json_path, blob_path, expected_size, total_chunks)
-                        return False
-                
-                    # Read chunk data
-                    chunk_data = b''
-                    for data in response.iter_content(chunk_size=65536):
-                        chunk_data += data
-                
-                    if len(chunk_data) != actual_chunk_size:
-                        self.logger.error(f"Chunk {chunk_id} size mismatch: got {len(chunk_data)}, expected {actual_chunk_size}")
-                        # Update JSON with current progress before failing
-                        self._update_json_with_current_chunks(json_path, blob_path, expected_size, total_chunks)
-                        return False
+            # Download missing/corrupted chunks with incremental JSON updates
+            try:
+                for i, chunk_id in enumerate(chunks_to_download):
+                    chunk_start, chunk_end = chunk_range(chunk_id)
+                    actual_chunk_size = chunk_end - chunk_start + 1
                 
-                    # Calculate multi-hash checksums for the chunk
-                    chunk_md5 = hashlib.md5(chunk_data).hexdigest()
-                    chunk_sha1 = hashlib.sha1(chunk_data).hexdigest()
-                    chunk_sha256 = hashlib.sha256(chunk_data).hexdigest()
+                    self.logger.info(f"📥 [{i+1}/{len(chunks_to_download)}] Downloading chunk {chunk_id} ({chunk_start}-{chunk_end}, {actual_chunk_size:,} bytes)")
                 
-                    # Write chunk to file - smart file creation
-                    # Only allocate file space when we actually have data to write
-                    if not blob_path.exists():
-                        blob_path.parent.mkdir(parents=True, exist_ok=True)
-                        # Create empty file initially - we'll write chunks as we get them
-                        blob_path.touch()
+                    try:
+                        status_code, chunk_data = pending.popleft().result()
                     
-                    # Expand file if needed to accommodate this chunk
-                    current_size = blob_path.stat().st_size if blob_path.exists() else 0
-                    required_size = chunk_end + 1
+                        if status_code not in (206, 200):  # 206 = Partial Content, 200 = OK (full file)
+                            self.logger.error(f"Range request failed for chunk {chunk_id}: HTTP {status_code}")
+                            # Update JSON with current progress before failing
+                            save_progress()
+                            return False
                     
-                    if current_size < required_size:
-                        # Extend file to accommodate this chunk (without zero-filling gaps)
-                        with open(blob_path, 'r+b') as f:
-                            f.seek(required_size - 1)
-                            f.write(b'\0')
+                        if len(chunk_data) != actual_chunk_size:
+                            self.logger.error(f"Chunk {chunk_id} size mismatch: got {len(chunk_data)}, expected {actual_chunk_size}")
+                            # Update JSON with current progress before failing
+                            save_progress()
+                            return False
                     
-                    # Write chunk data at correct position
-                    with open(blob_path, 'r+b') as f:
-                        f.seek(chunk_start)
-                        f.write(chunk_data)
-                
-                    # Update existing_chunks with new chunk data
-                    existing_chunks[chunk_id] = {
-                        'from': chunk_start,
-                        'to': chunk_end,
-                        'md5': chunk_md5,
-                        'sha1': chunk_sha1,
-                        'sha256': chunk_sha256
-                    }
-                
-                    # Incrementally update overall hashes with this new chunk
-                    # This is O(1) instead of O(n) - much more efficient!
-                    overall_md5.update(chunk_data)
-                    overall_sha1.update(chunk_data)
-                    overall_sha256.update(chunk_data)
-                
-                    # Create incremental hash objects for JSON update
-                    # Use copy() to preserve state for next iteration
-                    incremental_hashes = {
-                        'md5': overall_md5.copy(),
-                        'sha1': overall_sha1.copy(),
-                        'sha256': overall_sha256.copy()
-                    }
-                
-                    # Incrementally update JSON file after each successful chunk
-                    # Pass incremental hashes to avoid re-reading entire file
-                    # Pass the chunk that was just downloaded to get a new timestamp
-                    self._update_json_with_current_chunks(json_path, blob_path, expected_size, total_chunks, 
-                                                         existing_chunks, incremental_hashes, {chunk_id})
-                
-                    # Progress logging
-                    progress = ((i + 1) / len(chunks_to_download)) * 100
-                    self.logger.info(f"   ✅ Chunk {chunk_id} complete ({progress:.1f}%) - JSON updated")
+                        # Keep the window full before this chunk is processed
+                        if i + BLOB_RANGE_WORKERS < len(chunks_to_download):
+                            pending.append(fetch(chunks_to_download[i + BLOB_RANGE_WORKERS]))
                     
-                except KeyboardInterrupt:
-                    self.logger.warning("⚠️  Download interrupted by user")
-                    # Update JSON with current progress before exiting - use incremental hashes if available
-                    if 'incremental_hashes' in locals():
-                        self._update_json_with_current_chunks(json_path, blob_path, expected_size, total_chunks, 
-                                                             existing_chunks, incremental_hashes, None)
-                    else:
-                        self._update_json_with_current_chunks(json_path, blob_path, expected_size, total_chunks, existing_chunks, None, None)
-                    self.logger.info("📋 JSON metadata saved with current progress")
-                    raise  # Re-raise to maintain interrupt behavior
-                except Exception as e:
-                    self.logger.error(f"Failed to download chunk {chunk_id}: {e}")
-                    # Update JSON with current progress before continuing/failing
-                    if 'incremental_hashes' in locals():
-                        self._update_json_with_current_chunks(json_path, blob_path, expected_size, total_chunks, 
-                                                             existing_chunks, incremental_hashes, None)
-                    else:
-                        self._update_json_with_current_chunks(json_path, blob_path, expected_size, total_chunks, existing_chunks, None, None)
-                    return False
+                        # Calculate multi-hash checksums for the chunk, and incrementally update the
+                        # overall hashes with it (O(1) instead of re-reading the file), one algorithm per thread
+                        chunk_md5, chunk_sha1, chunk_sha256 = _parallel_digests(
+                            chunk_data, (overall_md5, overall_sha1, overall_sha256))
+                    
+                        # Write chunk to file - smart file creation
+                        # Only create the file when we actually have data to write; it stays
+                        # open for the rest of the download
+                        if blob_fd is None:
+                            blob_path.parent.mkdir(parents=True, exist_ok=True)
+                            blob_fd = os.open(blob_path, _UPDATE_FLAGS, 0o666)
+                        
+                        # Write chunk data at correct position; writing past the end extends
+                        # the file (sparse, without zero-filling gaps)
+                        _write_at(blob_fd, chunk_data, chunk_start)
+                    
+                        # Update existing_chunks with new chunk data
+                        existing_chunks[chunk_id] = {
+                            'from': chunk_start,
+                            'to': chunk_end,
+                            'md5': chunk_md5,
+                            'sha1': chunk_sha1,
+                            'sha256': chunk_sha256
+                        }
+                    
+                        # Create incremental hash objects for JSON update
+                        # Use copy() to preserve state for next iteration
+                        incremental_hashes = {
+                            'md5': overall_md5.copy(),
+                            'sha1': overall_sha1.copy(),
+                            'sha256': overall_sha256.copy()
+                        }
+                    
+                        # Incrementally update JSON file every few chunks; every exit path below flushes too
+                        # Pass incremental hashes to avoid re-reading entire file
+                        # Pass the chunks downloaded since the last update to get new timestamps
+                        unflushed.add(chunk_id)
+                        json_updated = (len(unflushed) >= BLOB_JSON_FLUSH_CHUNKS or
+                                        time.monotonic() - last_flush >= BLOB_JSON_FLUSH_SECONDS)
+                        if json_updated:
+                            self._update_json_with_current_chunks(json_path, blob_path, expected_size, total_chunks, 
+                                                                 existing_chunks, incremental_hashes, unflushed)
+                            unflushed = set()
+                            last_flush = time.monotonic()
+                    
+                        # Progress logging
+                        progress = ((i + 1) / len(chunks_to_download)) * 100
+                        self.logger.info(f"   ✅ Chunk {chunk_id} complete ({progress:.1f}%)" + (" - JSON updated" if json_updated else ""))
+                        
+                    except KeyboardInterrupt:
+                        self.logger.warning("⚠️  Download interrupted by user")
+                        # Update JSON with current progress before exiting
+                        save_progress()
+                        self.logger.info("📋 JSON metadata saved with current progress")
+                        raise  # Re-raise to maintain interrupt behavior
+                    except Exception as e:
+                        self.logger.error(f"Failed to download chunk {chunk_id}: {e}")
+                        # Update JSON with current progress before continuing/failing
+                        save_progress()
+                        return False
+            finally:
+                # Cancel queued ranges one by one (cancel_futures needs 3.9+), cut short the ones
+                # already streaming, and wait so no download outlives a failed blob
+                for future in pending:
+                    future.cancel()
+                fetch_stop.set()
+                fetcher.shutdown(wait=True)
+                if blob_fd is not None:
+                    os.close(blob_fd)
         
             # Final JSON validation and completion
             self.logger.info("📋 Performing final JSON validation...")
@@ -2663,7 +3488,7 @@ class GOGGalaxyArchiver:
                 'sha256': overall_sha256.copy()
             }
             final_json_success = self._update_json_with_current_chunks(json_path, blob_path, expected_size, total_chunks, 
-                                                                      existing_chunks, final_incremental_hashes, None)
+                                                                      existing_chunks, final_incremental_hashes, unflushed)
             if not final_json_success:
                 self.logger.warning("⚠️  Final JSON validation failed (download still successful)")
         
@@ -2674,6 +3499,17 @@ class GOGGalaxyArchiver:
             self.logger.error(f"Block-based download failed: {e}")
             return False
 
+    def _fetch_blob_range(self, blob_url: str, chunk_start: int, chunk_end: int,
+                          stop: Optional[threading.Event] = None) -> Tuple[int, Optional[bytearray]]:
+        """GET one byte range of a v1 blob: (HTTP status, body), body None unless 200/206"""
+        headers = {'Range': f'bytes={chunk_start}-{chunk_end}'}
+        response = self.api_handler.session.get(blob_url, headers=headers, stream=True, timeout=(30, 300))
+        with contextlib.closing(response):
+            if response.status_code not in (206, 200):
+                return response.status_code, None
+            # Read chunk data straight into a buffer of the expected size
+            return response.status_code, _read_body_into(response, chunk_end - chunk_start + 1, stop=stop)
+
     def _update_json_with_current_chunks(self, json_path: Path, blob_path: Path, expected_size: int, 
                                         total_chunks: int, current_chunks: dict = None, 
                                         incremental_overall_hashes: dict = None, 
@@ -2685,7 +3521,6 @@ class GOGGalaxyArchiver:
                                       for incremental updates instead of re-reading file
             newly_processed_chunks: Set of chunk IDs that were just downloaded/validated and need new timestamps
         """
-        from datetime import datetime
         
         chunk_size = 100 * 1024**2  # 100 MiB chunks
         
@@ -2700,22 +3535,18 @@ class GOGGalaxyArchiver:
                 
                 # Validate chunks against actual file content
                 if blob_path.exists():
-                    with open(blob_path, 'rb') as f:
+                    with _mapped_view(blob_path) as mv:
                         for chunk_id in range(total_chunks):
                             chunk_start = chunk_id * chunk_size
                             chunk_end = min(chunk_start + chunk_size - 1, expected_size - 1)
                             actual_chunk_size = chunk_end - chunk_start + 1
                             
-                            # Read chunk data
-                            f.seek(chunk_start)
-                            chunk_data = f.read(actual_chunk_size)
-                            
                             # Only calculate hashes for chunks that have the right size
-                            if len(chunk_data) == actual_chunk_size and chunk_data != b'\x00' * actual_chunk_size:
+                            with mv[chunk_start:chunk_end + 1] as chunk_data:
+                                if len(chunk_data) != actual_chunk_size or chunk_data == bytes(actual_chunk_size):
+                                    continue
                                 # Calculate all three hash types
-                                chunk_md5 = hashlib.md5(chunk_data).hexdigest()
-                                chunk_sha1 = hashlib.sha1(chunk_data).hexdigest()
-                                chunk_sha256 = hashlib.sha256(chunk_data).hexdigest()
+                                chunk_md5, chunk_sha1, chunk_sha256 = _parallel_digests(chunk_data)
                                 
                                 current_chunks[chunk_id] = {
                                     'from': chunk_start,
@@ -2739,19 +3570,16 @@ class GOGGalaxyArchiver:
                 
                 # Read file in chunk order and update overall hashes
                 if blob_path.exists():
-                    with open(blob_path, 'rb') as f:
+                    with _mapped_view(blob_path, drop_cache=True) as mv:
                         for chunk_id in sorted(current_chunks.keys()):
                             chunk_start = current_chunks[chunk_id]['from']
                             chunk_end = current_chunks[chunk_id]['to']
-                            actual_chunk_size = chunk_end - chunk_start + 1
-                            
-                            f.seek(chunk_start)
-                            chunk_data = f.read(actual_chunk_size)
                             
                             # Add to overall hash
-                            overall_md5.update(chunk_data)
-                            overall_sha1.update(chunk_data)
-                            overall_sha256.update(chunk_data)
+                            with mv[chunk_start:chunk_end + 1] as chunk_data:
+                                overall_md5.update(chunk_data)
+                                overall_sha1.update(chunk_data)
+                                overall_sha256.update(chunk_data)
                 
                 overall_md5_hex = overall_md5.hexdigest()
                 overall_sha1_hex = overall_sha1.hexdigest()
@@ -2764,8 +3592,7 @@ class GOGGalaxyArchiver:
             existing_chunk_states = {}
             if json_path.exists():
                 try:
-                    with open(json_path, 'r', encoding='utf-8') as f:
-                        existing_json = json.load(f)
+                    existing_json = _json_loads(json_path.read_bytes())
                     existing_chunk_states = existing_json.get('chunk_states', {})
                 except Exception as e:
                     self.logger.warning(f"Failed to load existing chunk states: {e}")
@@ -2819,8 +3646,7 @@ class GOGGalaxyArchiver:
             
             # Write JSON file atomically (write to temp, then rename)
             temp_json_path = json_path.with_suffix('.json.tmp')
-            with open(temp_json_path, 'w', encoding='utf-8') as f:
-                json.dump(json_data, f, indent=2, sort_keys=True)
+            _write_file(temp_json_path, _pretty_json(json_data, sort_keys=True))
             
             # Atomic rename
             temp_json_path.replace(json_path)
@@ -2840,8 +3666,7 @@ class GOGGalaxyArchiver:
         """Parse existing JSON checksum file to get chunk metadata"""
         chunks = {}
         try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _json_loads(json_path.read_bytes())
             
             # Extract chunk data from JSON structure
             chunk_hashes = data.get('chunk_hashes', {})
@@ -2865,7 +3690,6 @@ class GOGGalaxyArchiver:
 
     def _parse_existing_checksum_xml(self, xml_path: Path) -> dict:
         """Parse existing XML checksum file to get chunk metadata (supports both formats)"""
-        import xml.etree.ElementTree as ET
     
         chunks = {}
         try:
@@ -2990,7 +3814,6 @@ class GOGGalaxyArchiver:
     def _download_v2_chunks(self, game_id: str, chunk_md5s: set, max_workers: int = 4) -> Dict:
         """Download V2 chunks for a game using multi-threaded approach with base URL"""
         # from gogdl.dl import dl_utils
-        from concurrent.futures import ThreadPoolExecutor, as_completed
         
         result = {'chunks_archived': 0, 'errors': []}
         
@@ -3001,16 +3824,19 @@ class GOGGalaxyArchiver:
         validated_count = 0
         chunk_num = 0
         
-        for chunk_md5 in chunk_md5s:
-            chunk_num += 1
-            print(f"   🔍 [{chunk_num}/{len(chunk_md5s)}] Validating chunk: {chunk_md5}")
-            
-            if self._validate_chunk_exists_with_hash(chunk_md5):
-                validated_count += 1
-                print(f"      ✅ Chunk exists and is valid")
-            else:
-                chunks_to_download.append(chunk_md5)
-                print(f"      ❌ Chunk missing or corrupted - will download")
+        pending = list(chunk_md5s)
+        for start in range(0, len(pending), MD5_BATCH_SIZE):
+            batch = pending[start:start + MD5_BATCH_SIZE]
+            for chunk_md5, valid in zip(batch, self._validate_chunks_exist_with_hash(batch)):
+                chunk_num += 1
+                print(f"   🔍 [{chunk_num}/{len(chunk_md5s)}] Validating chunk: {chunk_md5}")
+                
+                if valid:
+                    validated_count += 1
+                    print(f"      ✅ Chunk exists and is valid")
+                else:
+                    chunks_to_download.append(chunk_md5)
+                    print(f"      ❌ Chunk missing or corrupted - will download")
         
         print(f"   ✅ Chunks validated: {validated_count}")
         print(f"   📥 Chunks to download: {len(chunks_to_download)}")
@@ -3113,8 +3939,7 @@ class GOGGalaxyArchiver:
         try:
             # Critical: Validate hash matches filename for integrity
             print(f"         🔐 Validating MD5 hash...")
-            with open(chunk_path, 'rb') as f:
-                actual_hash = hashlib.md5(f.read()).hexdigest()
+            actual_hash = _hash_file(chunk_path, 'md5')
             
             expected_hash = chunk_md5.lower()
             matches = actual_hash.lower() == expected_hash
@@ -3130,6 +3955,25 @@ class GOGGalaxyArchiver:
             print(f"         💥 Exception during hash validation: {e}")
             return False
 
+    def _validate_chunks_exist_with_hash(self, chunk_md5s: List[str]) -> List[bool]:
+        """Validate a batch of chunks against their filenames, hashing them in parallel"""
+        results = [False] * len(chunk_md5s)
+        indices = []
+        buffers = []
+        for i, chunk_md5 in enumerate(chunk_md5s):
+            chunk_path = self.chunks_dir / chunk_md5[:2] / chunk_md5[2:4] / chunk_md5
+            try:
+                with open(chunk_path, 'rb') as f:
+                    buffers.append(f.read())
+                indices.append(i)
+            except OSError:
+                continue
+                
+        for i, actual_hash in zip(indices, _batch_md5(buffers)):
+            results[i] = actual_hash == chunk_md5s[i].lower()
+            
+        return results
+
     def validate_archive_comprehensive(self, game_id: str = None, build_id: str = None, platforms: List[str] = None) -> Dict:
         """Comprehensive archive validation for both V1 and V2 builds
         
@@ -3170,11 +4014,11 @@ class GOGGalaxyArchiver:
             if game_id and build_id:
                 # Validate specific build
                 for platform in platforms:
-                    build_key = f"{game_id}_{build_id}_{platform}"
+                    build_key = (game_id, build_id, platform)
                     if build_key in self.archived_builds:
                         builds_to_validate.append(self.archived_builds[build_key])
                     else:
-                        print(f"⚠️  Build not found in archive: {build_key}")
+                        print(f"⚠️  Build not found in archive: {game_id}/{build_id}/{platform}")
             elif game_id:
                 # Validate all builds for a game
                 for build in self.archived_builds.values():
@@ -3275,16 +4119,7 @@ class GOGGalaxyArchiver:
             
             # Read and parse build manifest
             try:
-                with open(build_manifest_path, 'rb') as f:
-                    raw_data = f.read()
-                
-                # Decompress V2 manifest
-                if raw_data.startswith(b'\x1f\x8b'):  # gzip
-                    manifest_data = json.loads(gzip.decompress(raw_data).decode('utf-8'))
-                elif raw_data.startswith(b'\x78'):  # zlib
-                    manifest_data = json.loads(zlib.decompress(raw_data).decode('utf-8'))
-                else:
-                    manifest_data = json.loads(raw_data.decode('utf-8'))
+                manifest_data = self._load_build_manifest(build_manifest_path)
             except Exception as e:
                 result['success'] = False
                 result['errors'].append(f"Failed to parse build manifest: {e}")
@@ -3338,15 +4173,12 @@ class GOGGalaxyArchiver:
         
         try:
             # Find depot manifest file
-            galaxy_path = manifest_id if "/" in manifest_id else f"{manifest_id[0:2]}/{manifest_id[2:4]}/{manifest_id}"
-            depot_paths = [
-                self.archive_root / "manifests" / "v2" / "depots" / galaxy_path,
-                self.archive_root / "manifests" / "v2" / "meta" / galaxy_path
-            ]
+            galaxy_path = _galaxy_path(manifest_id)
+            depot_paths = [self._v2_depots_prefix + galaxy_path, self._v2_meta_prefix + galaxy_path]
             
             depot_manifest_path = None
             for path in depot_paths:
-                if path.exists():
+                if os.path.exists(path):
                     depot_manifest_path = path
                     break
             
@@ -3356,15 +4188,7 @@ class GOGGalaxyArchiver:
                 return result
             
             # Load and parse depot manifest
-            with open(depot_manifest_path, 'rb') as f:
-                raw_data = f.read()
-            
-            if raw_data.startswith(b'\x1f\x8b'):  # gzip
-                depot_data = json.loads(gzip.decompress(raw_data).decode('utf-8'))
-            elif raw_data.startswith(b'\x78'):  # zlib
-                depot_data = json.loads(zlib.decompress(raw_data, 15).decode('utf-8'))
-            else:
-                depot_data = json.loads(raw_data.decode('utf-8'))
+            depot_data = _read_manifest(depot_manifest_path)
             
             # Extract chunks from depot manifest
             chunks_to_validate = set()
@@ -3430,20 +4254,7 @@ class GOGGalaxyArchiver:
             
             # Read and parse V1 repository manifest (plain JSON)
             try:
-                with open(build_manifest_path, 'rb') as f:
-                    raw_data = f.read()
-                
-                # V1 manifests might be compressed or plain JSON
-                try:
-                    if raw_data.startswith(b'\x1f\x8b'):  # gzip
-                        manifest_data = json.loads(gzip.decompress(raw_data).decode('utf-8'))
-                    elif raw_data.startswith(b'\x78'):  # zlib
-                        manifest_data = json.loads(zlib.decompress(raw_data).decode('utf-8'))
-                    else:
-                        manifest_data = json.loads(raw_data.decode('utf-8'))
-                except:
-                    # Try as plain JSON
-                    manifest_data = json.loads(raw_data.decode('utf-8'))
+                manifest_data = self._load_build_manifest(build_manifest_path)
             except Exception as e:
                 result['success'] = False
                 result['errors'].append(f"Failed to parse repository manifest: {e}")
@@ -3480,17 +4291,7 @@ class GOGGalaxyArchiver:
                 
                 try:
                     # Load depot manifest
-                    with open(depot_manifest_path, 'rb') as f:
-                        raw_data = f.read()
-                    
-                    # Parse JSON
-                    try:
-                        depot_data = json.loads(raw_data.decode('utf-8'))
-                    except:
-                        if raw_data.startswith(b'\x1f\x8b'):
-                            depot_data = json.loads(gzip.decompress(raw_data).decode('utf-8'))
-                        else:
-                            raise
+                    depot_data = _read_manifest(depot_manifest_path)
                     
                     # Extract files from this depot
                     depot_files = depot_data.get('depot', {}).get('files', [])
@@ -3604,18 +4405,8 @@ class GOGGalaxyArchiver:
                 return result
             
             # Load depot manifest
-            with open(depot_manifest_path, 'rb') as f:
-                raw_data = f.read()
-            
             # V1 depot manifests are typically plain JSON
-            try:
-                depot_data = json.loads(raw_data.decode('utf-8'))
-            except:
-                # Try decompression if needed
-                if raw_data.startswith(b'\x1f\x8b'):
-                    depot_data = json.loads(gzip.decompress(raw_data).decode('utf-8'))
-                else:
-                    raise
+            depot_data = _read_manifest(depot_manifest_path)
             
             # Extract file list with blob references
             files_to_validate = []
@@ -3892,15 +4683,10 @@ class GOGGalaxyArchiver:
             response.raise_for_status()
             
             # Save chunk to archive using compressedMd5 directory structure
-            chunk_path = self._save_raw_chunk(chunk_md5, response.content)
-            
-            # Verify hash matches (compressedMd5 should match what we downloaded)
-            actual_hash = hashlib.md5(response.content).hexdigest()
-            if actual_hash != chunk_md5:
-                self.logger.error(f"Chunk hash mismatch: expected {chunk_md5}, got {actual_hash}")
-                return None
+            # (hashed while writing; a compressedMd5 mismatch raises and nothing is kept)
+            chunk_path = self._save_raw_chunk(chunk_md5, response.content, expected_md5=chunk_md5)
             
-            print(f"   ✅ Hash verified: {actual_hash}")
+            print(f"   ✅ Hash verified: {chunk_md5}")
             print(f"   💾 Saved to: {chunk_path}")
             
             # Create archived chunk record
@@ -3944,13 +4730,8 @@ class GOGGalaxyArchiver:
             response.raise_for_status()
             
             # Save chunk to archive using the same directory structure as chunks_dir
-            chunk_path = self._save_raw_chunk(chunk_md5, response.content)
-            
-            # Verify hash matches
-            actual_hash = hashlib.md5(response.content).hexdigest()
-            if actual_hash != chunk_md5:
-                self.logger.error(f"Chunk hash mismatch: expected {chunk_md5}, got {actual_hash}")
-                return None
+            # (hashed while writing; a compressedMd5 mismatch raises and nothing is kept)
+            chunk_path = self._save_raw_chunk(chunk_md5, response.content, expected_md5=chunk_md5)
             
             # Create archived chunk record
             archived_chunk = ArchivedChunk(
@@ -4099,7 +4880,7 @@ class GOGGalaxyArchiver:
             
             # Save chunk to archive
             chunk_path = self.chunks_dir / f"{chunk_md5[:2]}" / f"{chunk_md5[2:4]}" / f"{chunk_md5}.chunk"
-            chunk_path.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(chunk_path.parent)
             
             compressed_size = 0
             chunk_hash = hashlib.md5()
@@ -4163,14 +4944,9 @@ class GOGGalaxyArchiver:
             
             # Save blob to archive using depot manifest as filename
             blob_path = self.blobs_dir / f"{depot_manifest[:2]}" / f"{depot_manifest[2:4]}" / f"{depot_manifest}.bin"
-            blob_path.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(blob_path.parent)
             
-            total_size = 0
-            
-            with open(blob_path, 'wb') as f:
-                for chunk_data in response.iter_content(chunk_size=8192):
-                    f.write(chunk_data)
-                    total_size += len(chunk_data)
+            total_size = _write_stream(blob_path, response.iter_content(chunk_size=STREAM_CHUNK_SIZE))
                     
             # Create archived blob record
             archived_blob = ArchivedBlob(
@@ -4372,7 +5148,7 @@ class GOGGalaxyArchiver:
                 platform = api_build['platform']
                 
                 # Check if we have this build in our database
-                build_key = f"{game_id}_{build_id}_{platform}"
+                build_key = (game_id, build_id, platform)
                 
                 if build_key in self.archived_builds:
                     # Update existing build with missing metadata
@@ -4383,7 +5159,7 @@ class GOGGalaxyArchiver:
                     
                     if not hasattr(existing_build, 'tags') or not existing_build.tags:
                         if api_build.get('tags'):
-                            existing_build.tags = api_build['tags']
+                            existing_build.tags = tuple(api_build['tags'])
                             needs_update = True
                             self.logger.debug(f"Updated tags for build {build_id}: {api_build['tags']}")
                     
@@ -4622,7 +5398,7 @@ class GOGGalaxyArchiver:
             for build_key, archived_build in self.archived_builds.items():
                 if archived_build.game_id == game_id and archived_build.build_id == build_id:
                     existing_builds.append(archived_build)
-                    self.logger.info(f"Found existing archived build: {build_key}")
+                    self.logger.info(f"Found existing archived build: {'/'.join(build_key)}")
             
             # If no existing builds found, try to discover and archive manifests
             if not existing_builds:
@@ -4703,7 +5479,7 @@ class GOGGalaxyArchiver:
         
         try:
             # Find the manifest in our archived manifests or get it
-            manifest_key = f"{game_id}_{build_id}_windows"  # Assume windows for now
+            manifest_key = (game_id, build_id, "windows")  # Assume windows for now
             
             if manifest_key not in self.archived_builds:
                 # Need to archive the build manifest first
@@ -4788,9 +5564,7 @@ class GOGGalaxyArchiver:
                 # V2 API: Use downloadable-manifests-collector for repository manifests
                 for platform in platforms: 
                     # V2 repositories use galaxy_path format for the repository ID
-                    galaxy_path = repository_id
-                    if "/" not in galaxy_path:
-                        galaxy_path = f"{repository_id[:2]}/{repository_id[2:4]}/{repository_id}"
+                    galaxy_path = _galaxy_path(repository_id)
                     
                     repository_url = f"{constants.GOG_MANIFESTS_COLLECTOR}/manifests/builds/{galaxy_path}"
                     print(f"   🔗 V2 Repository URL: {repository_url}")
@@ -4804,13 +5578,7 @@ class GOGGalaxyArchiver:
                     
                     # V2 manifests might be compressed
                     try:
-                        if response.content.startswith(b'\x1f\x8b'):  # gzip
-                            import gzip
-                            manifest_data = json.loads(gzip.decompress(response.content).decode('utf-8'))
-                        elif response.content.startswith(b'\x78'):  # zlib
-                            manifest_data = json.loads(zlib.decompress(response.content).decode('utf-8'))
-                        else:
-                            manifest_data = response.json()
+                        manifest_data = _json_loads(_decompress_manifest(response.content))
                     except Exception as e:
                         error_msg = f"Failed to parse V2 repository manifest: {e}"
                         results['errors'].append(error_msg)
@@ -4956,12 +5724,15 @@ def main():
     parser.add_argument('--verify-blob', help='Verify integrity of blob by depot manifest ID')
     parser.add_argument('--extract-file', nargs=3, metavar=('DEPOT_MANIFEST', 'FILE_PATH', 'OUTPUT_PATH'),
                        help='Extract file from v1 blob: depot_manifest file_path output_path')
+    parser.add_argument('--prettify', action='store_true', help='Also write human-readable .json copies of archived manifests')
+    parser.add_argument('--compress-database', action='store_true', help='Also keep a zstd copy of the archive database')
     
     args = parser.parse_args()
     
     logging.basicConfig(level=logging.INFO, format='[%(name)s] %(levelname)s: %(message)s')
     
-    archiver = GOGGalaxyArchiver(args.archive_root, args.auth_config)
+    archiver = GOGGalaxyArchiver(args.archive_root, args.auth_config, prettify=args.prettify,
+                                 compress_database=args.compress_database)
     
     if args.stats:
         stats = archiver.get_archive_stats()
@@ -259,6 +259,8 @@ def init_parser():
     archive_download_parser.add_argument("--manifests-only", action='store_true', help="Download only build and depot manifests, skip chunks/blobs")
     archive_download_parser.add_argument("--max-workers", type=int, default=4, help="Number of download threads (default: 4)")
     archive_download_parser.add_argument("--validate-existing", action='store_true', help="Validate existing chunks/blobs before download")
+    archive_download_parser.add_argument("--prettify", action='store_true', help="Also write human-readable .json copies of archived manifests")
+    archive_download_parser.add_argument("--compress-database", action='store_true', help="Also keep a zstd copy of the archive database (archive_database.json is always written)")
     
     # Repository mode arguments
     archive_download_parser.add_argument("--repository", help="Repository ID for repository-based download (alternative to --build-id)")
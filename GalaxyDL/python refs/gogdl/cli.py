@@ -21,7 +21,9 @@ def display_version():
 
 def archive_download(arguments, unknown_arguments):
     """Handle archive download subcommand - requires authentication"""
-    galaxy_archiver = archiver.GOGGalaxyArchiver(arguments.archive_root, arguments.auth_config_path)
+    galaxy_archiver = archiver.GOGGalaxyArchiver(arguments.archive_root, arguments.auth_config_path,
+                                                 prettify=arguments.prettify,
+                                                 compress_database=arguments.compress_database)
     
     # Handle 'all' platforms special case (default is already ['all'] from args.py)
     if 'all' in arguments.platforms:
@@ -112,6 +114,8 @@ def archive_download(arguments, unknown_arguments):
         else:
             results = galaxy_archiver.archive_game_complete(arguments.game_id, platforms, languages)
     
+    # Write the database now rather than when the save debounce timer fires
+    galaxy_archiver.flush()
     print(json.dumps(results, indent=2))
 
 
@@ -229,11 +233,9 @@ def archive_list(arguments, unknown_arguments):
         database_path = archive_root / "metadata" / "archive_database.json"
         builds_found = []
         
-        if database_path.exists():
+        if database_path.exists() or database_path.with_suffix('.json.zst').exists():
             try:
-                import json
-                with open(database_path, 'r') as f:
-                    data = json.load(f)
+                data = archiver.read_archive_database(database_path)
                 
                 builds_data = data.get('builds', [])
                 for build in builds_data:
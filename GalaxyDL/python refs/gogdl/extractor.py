@@ -14,6 +14,8 @@ import logging
 from typing import Dict, List, Optional, Set, Tuple
 import hashlib
 
+from gogdl.archiver import read_archive_database
+
 
 class GOGArchiveExtractor:
     """Extract files from archived V1 blobs and V2 chunks"""
@@ -41,11 +43,7 @@ class GOGArchiveExtractor:
         
         # Load archive database for build mapping
         self.database_path = self.archive_root / "metadata" / "archive_database.json"
-        if self.database_path.exists():
-            with open(self.database_path, 'r', encoding='utf-8') as f:
-                self.database = json.load(f)
-        else:
-            self.database = {'builds': []}
+        self.database = read_archive_database(self.database_path) or {'builds': []}
         
         self.logger.info(f"Initialized extractor for archive: {archive_root}")
         self.logger.info(f"Loaded {len(self.database.get('builds', []))} builds from database")